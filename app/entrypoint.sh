@@ -13,7 +13,7 @@ case "$PGID" in (*[!0-9]*) echo "ERROR: PGID must be numeric (got '$PGID')" >&2;
 umask "$UMASK" || true
 
 # Create app-data directories
-mkdir -p /data /data/config /data/logs
+mkdir -p /data /data/config /data/logs /data/cache
 
 # Put default cover art in /data if not already there
 if [ ! -d "/data/cover" ]; then
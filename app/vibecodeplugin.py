@@ -11,14 +11,24 @@ import time
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import schedule
-import signal
 import re
+import random
+import threading
+import traceback
+import hashlib
+import shutil
+import functools
+from operator import itemgetter, methodcaller
+from collections import Counter, defaultdict
+from itertools import chain
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 from io import BytesIO
 
 # PIL/Pillow imports for custom cover art generation
@@ -29,9 +39,61 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+# Optional PyTurboJPEG encoder, enabled with TURBOJPEG=1 (needs the libturbojpeg shared library)
+_TURBOJPEG_ENABLED = os.getenv('TURBOJPEG', '').lower() in ('1', 'true', 'yes')
+_turbojpeg = None
+if _TURBOJPEG_ENABLED:
+    try:
+        from turbojpeg import TurboJPEG, TJSAMP_420
+    except ImportError:
+        _TURBOJPEG_ENABLED = False
+
+# NumPy is used on its own for vectorized genre similarity (bitwise_count needs numpy 2.x)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = hasattr(np, 'bitwise_count')
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# orjson parses large Jellyfin responses considerably faster than the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# sqlite3 backs the persistent HTTP cache; some minimal Python builds ship without it
+try:
+    import sqlite3
+    SQLITE_AVAILABLE = True
+except ImportError:
+    SQLITE_AVAILABLE = False
+
+# lxml builds and serializes playlist XML in libxml2; fall back to the stdlib tree
+try:
+    from lxml.etree import Element, SubElement, tostring
+    LXML_AVAILABLE = True
+except ImportError:
+    from xml.etree.ElementTree import Element, SubElement, tostring, indent
+    LXML_AVAILABLE = False
+
 # Configuration
 
 # --- Name normalization helper ---
+# Unicode quotes/apostrophes and dash variants -> ASCII, used by normalize_name
+_NAME_PUNCT_TABLE = str.maketrans({
+    '\u2018': "'",  # left single quotation mark
+    '\u2019': "'",  # right single quotation mark (Guns N’ Roses)
+    '\u201B': "'",  # single high-reversed-9 quotation mark
+    '\u2032': "'",  # prime
+    '\u02BC': "'",  # modifier letter apostrophe
+    '\uFF07': "'",  # fullwidth apostrophe
+    '\u201C': '"',   # left double quotation mark
+    '\u201D': '"',   # right double quotation mark
+    '\uFF02': '"',   # fullwidth quotation mark
+    **{dash: '-' for dash in '\u2010\u2011\u2012\u2013\u2014\u2015'},
+})
+
 def normalize_name(s: str) -> str:
     """Normalize playlist/artist names to avoid Unicode punctuation mismatches.
     Converts curly quotes/apostrophes and dash variants to ASCII, applies NFKC, trims.
@@ -40,24 +102,573 @@ def normalize_name(s: str) -> str:
         return ''
     # Normalize compatibility forms (e.g., fullwidth quotes) and compose
     s = unicodedata.normalize('NFKC', s)
-    # Replace common Unicode quotes/apostrophes with ASCII
-    quote_map = {
-        '\u2018': "'",  # left single quotation mark
-        '\u2019': "'",  # right single quotation mark (Guns N’ Roses)
-        '\u201B': "'",  # single high-reversed-9 quotation mark
-        '\u2032': "'",  # prime
-        '\u02BC': "'",  # modifier letter apostrophe
-        '\uFF07': "'",  # fullwidth apostrophe
-        '\u201C': '"',   # left double quotation mark
-        '\u201D': '"',   # right double quotation mark
-        '\uFF02': '"',   # fullwidth quotation mark
-    }
-    for k, v in quote_map.items():
-        s = s.replace(k, v)
-    # Replace dash variants with ASCII hyphen
-    for dash in ['\u2010', '\u2011', '\u2012', '\u2013', '\u2014', '\u2015']:
-        s = s.replace(dash, '-')
+    # Replace common Unicode quotes/apostrophes and dash variants with ASCII in one pass
+    s = s.translate(_NAME_PUNCT_TABLE)
     return s.strip()
+
+# Cleanup applied to playlist names after normalize_name: null bytes removed
+_PLAYLIST_NAME_TABLE = str.maketrans({'\x00': None})
+
+# Characters Jellyfin replaces with a space in playlist folder names
+_INVALID_DIR_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+
+# --- JSON helpers (orjson when available) ---
+def _json_loads(data):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _parse_json(response):
+    """Parse a requests response body as JSON.
+    Decode errors are raised as a RequestException, matching response.json().
+    """
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=response)
+
+# --- Atomic file write helpers ---
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write data to path via a temp file and os.replace.
+    Jellyfin may scan the playlist folder at any moment; the rename guarantees
+    it only ever sees the old file or the complete new one.
+    """
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    try:
+        with open(tmp, 'wb', buffering=65536) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+def _get_turbojpeg():
+    """Shared PyTurboJPEG handle, or None if it is disabled or cannot load libturbojpeg"""
+    global _TURBOJPEG_ENABLED, _turbojpeg
+    if _turbojpeg is None and _TURBOJPEG_ENABLED:
+        try:
+            _turbojpeg = TurboJPEG(os.getenv('TURBOJPEG_LIB') or None)
+        except Exception as e:
+            logging.getLogger('jellyjams').warning(f"TURBOJPEG set but libturbojpeg could not be loaded: {e}")
+            _TURBOJPEG_ENABLED = False
+    return _turbojpeg
+
+# Encoder settings for generated covers when the caller passes none
+COVER_FORMATS = {
+    'webp': ('.webp', 'WEBP', {'quality': 90, 'method': 4}),
+    'jpeg': ('.jpg', 'JPEG', {'quality': 85}),
+}
+_COVER_SAVE_PARAMS = {fmt: params for _, fmt, params in COVER_FORMATS.values()}
+_COVER_EXTENSIONS = tuple(ext for ext, _, _ in COVER_FORMATS.values())
+
+def _remove_other_cover_formats(path: Path):
+    """Delete cover/folder images next to path that share its name in another cover format.
+    Switching COVER_FORMAT would otherwise leave e.g. a stale folder.jpg beside the new
+    folder.webp, and Jellyfin may keep showing the old one.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    for ext in _COVER_EXTENSIONS:
+        if ext != suffix:
+            try:
+                path.with_suffix(ext).unlink()
+            except FileNotFoundError:
+                pass
+
+def _encode_image(img, format: str, **params) -> bytes:
+    """Encode a PIL image to bytes. JPEG goes straight through libturbojpeg when enabled."""
+    if not params:
+        params = _COVER_SAVE_PARAMS.get(format, {})
+    if format and format.upper() in ('JPEG', 'JPG'):
+        if img.mode not in ('RGB', 'L', 'CMYK'):
+            img = img.convert('RGB')
+        turbo = _get_turbojpeg()
+        if turbo is not None:
+            rgb = img if img.mode == 'RGB' else img.convert('RGB')
+            # PyTurboJPEG expects BGR pixel order by default
+            return turbo.encode(np.asarray(rgb)[:, :, ::-1], quality=params.get('quality', 85),
+                                jpeg_subsample=TJSAMP_420)
+    buffer = BytesIO()
+    img.save(buffer, format, **params)
+    return buffer.getvalue()
+
+def _check_image_codecs(logger):
+    """Log which JPEG encoder cover art will use"""
+    if not PIL_AVAILABLE:
+        return
+    if _get_turbojpeg() is not None:
+        logger.info("🖼️ Using libturbojpeg (PyTurboJPEG) for JPEG cover encoding")
+        return
+    try:
+        from PIL import features
+        if features.check_feature('libjpeg_turbo'):
+            logger.debug("Pillow is built with libjpeg-turbo")
+        else:
+            logger.warning("Pillow is not built with libjpeg-turbo; JPEG cover encoding will be slower")
+    except Exception as e:
+        logger.debug(f"Could not check Pillow JPEG features: {e}")
+
+def _save_image_atomic(img, path: Path, format: str = None, **params):
+    """Encode a PIL image in memory and write it atomically to path.
+    The format defaults to the one registered for the file extension.
+    """
+    path = Path(path)
+    if format is None:
+        format = Image.registered_extensions().get(path.suffix.lower())
+    _atomic_write_bytes(path, _encode_image(img, format, **params))
+    _remove_other_cover_formats(path)
+
+def _fast_copy(source: Path, destination: Path):
+    """Copy source to destination atomically with the cheapest mechanism available.
+    Tries a kernel-side os.sendfile, then shutil.copyfile, writing a temp file that
+    is renamed over destination. The copy never shares an inode with the source, so
+    later chmods or edits of the cover leave the template alone.
+    Only the contents are copied; a cover has no use for the source's stat metadata.
+    """
+    source, destination = Path(source), Path(destination)
+    tmp = destination.with_suffix(destination.suffix + '.tmp')
+    try:
+        tmp.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        try:
+            with open(source, 'rb') as src, open(tmp, 'wb') as dst:
+                size = os.fstat(src.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                os.fsync(dst.fileno())
+        except (OSError, AttributeError):
+            # No sendfile for this platform/filesystem combination
+            shutil.copyfile(source, tmp)
+        os.replace(tmp, destination)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    _remove_other_cover_formats(destination)
+
+def _ensure_world_readable(path: Path, logger):
+    """chmod a cover file to 0664 so it is readable on host mounts"""
+    try:
+        os.chmod(path, 0o664)
+    except Exception as chmod_err:
+        logger.debug(f"chmod failed for {path}: {chmod_err}")
+
+def _normalize_item_genres(items: List[Dict]) -> List[Dict]:
+    """Coerce each item's Genres to a list of strings in place.
+    Done once at ingest so hot loops never need to type-check the field.
+    """
+    for item in items:
+        genres = item.get('Genres')
+        if isinstance(genres, list):
+            if not all(isinstance(g, str) for g in genres):
+                item['Genres'] = [g for g in genres if isinstance(g, str)]
+        elif isinstance(genres, str):
+            item['Genres'] = [genres]
+        else:
+            item['Genres'] = []
+    return items
+
+def _iter_genres(tracks: List[Dict]):
+    """Yield every genre of tracks, splitting semicolon-separated entries.
+    Genres may be a list or a single string.
+    """
+    for track in tracks:
+        genres = track.get('Genres')
+        if not genres:
+            continue
+        if isinstance(genres, str):
+            genres = (genres,)
+        elif not isinstance(genres, list):
+            continue
+        for genre in genres:
+            if isinstance(genre, str) and ';' in genre:
+                yield from (g for g in map(str.strip, genre.split(';')) if g)
+            else:
+                yield genre
+
+# Generic cover fallbacks: playlist name marker -> cover file stem, in priority order
+FALLBACK_MAP = {
+    'Top Tracks -': 'Top Tracks - all',
+    'Discovery Mix -': 'Discovery Mix - all',
+    'Recent Favorites -': 'Recent Favorites - all',
+    'Genre Mix -': 'Genre Mix - all',
+    'This is': 'This is - all',
+    'Radio': 'Radio - all',
+    'Back to': 'Back to - all',
+}
+
+FALLBACK_RE = re.compile('|'.join(re.escape(marker) for marker in FALLBACK_MAP))
+_FALLBACK_PRIORITY = {marker: rank for rank, marker in enumerate(FALLBACK_MAP)}
+
+# --- Genre cover rendering (runs in a worker process) ---
+_GENRE_COVER_SIZE = (600, 600)
+_ARTIST_FONT_PATHS = (
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',  # Linux
+    '/System/Library/Fonts/Helvetica.ttc',  # macOS
+    'arial.ttf',  # Windows fallback
+)
+# File names accepted as cover art inside an artist folder (compared lowercased)
+_COVER_FILENAMES = frozenset(
+    f"{stem}.{ext}"
+    for stem in ('folder', 'cover', 'artist', 'thumb', 'front')
+    for ext in ('jpg', 'jpeg', 'png', 'webp', 'avif', 'bmp')
+)
+# A playlist folder's own cover image, e.g. cover.webp or Cover.JPG
+_EXISTING_COVER_RE = re.compile(r'^cover\.(jpe?g|png|webp|bmp|avif)$', re.IGNORECASE)
+
+def _find_existing_cover(directory: Path) -> Optional[Path]:
+    """First cover.<image ext> file in directory, matched with a single scandir"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if _EXISTING_COVER_RE.match(entry.name) and entry.is_file():
+                    return Path(entry.path)
+    except OSError:
+        pass
+    return None
+
+# Unicode punctuation that cover fonts can't render, mapped to ASCII
+_FONT_SANITIZE_TABLE = str.maketrans({
+    '\u2010': '-',  # Unicode hyphen → ASCII hyphen
+    '\u2011': '-',  # Non-breaking hyphen → ASCII hyphen
+    '\u2012': '-',  # Figure dash → ASCII hyphen
+    '\u2013': '-',  # En dash → ASCII hyphen
+    '\u2014': '-',  # Em dash → ASCII hyphen
+    '\u2015': '-',  # Horizontal bar → ASCII hyphen
+    '\u2018': "'", # Left single quotation mark → ASCII apostrophe
+    '\u2019': "'", # Right single quotation mark → ASCII apostrophe
+    '\u201C': '"',  # Left double quotation mark → ASCII quote
+    '\u201D': '"',  # Right double quotation mark → ASCII quote
+    '\u00A0': ' ',  # Non-breaking space → regular space
+})
+_GENRE_FONT_PATHS = (
+    "/System/Library/Fonts/Arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+)
+_GENRE_BG_CACHE = {}
+_GENRE_CACHE_LOCK = threading.Lock()
+
+def _load_genre_background(background_path: Path, cover_size):
+    """Load a genre template as an RGB image of cover_size, cached per file version.
+    Callers must copy() the result before drawing on it.
+    """
+    st = background_path.stat()
+    key = (str(background_path), st.st_mtime_ns, cover_size)
+    with _GENRE_CACHE_LOCK:
+        background = _GENRE_BG_CACHE.get(key)
+    if background is not None:
+        return background
+    
+    with Image.open(background_path) as background:
+        # For JPEG templates let libjpeg downscale while decoding (no-op for other formats)
+        background.draft('RGB', cover_size)
+        
+        # Convert to RGB if necessary
+        if background.mode != 'RGB':
+            background = background.convert('RGB')
+        
+        # Resize to standard cover art size unless the template already is.
+        # reducing_gap lets Pillow shrink large templates by an integer factor
+        # first (cheap box reduce) and only run LANCZOS on the last step.
+        if background.size != cover_size:
+            background = background.resize(cover_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+        background.load()
+    
+    with _GENRE_CACHE_LOCK:
+        # Drop older versions of the same template
+        for old_key in [k for k in _GENRE_BG_CACHE if k[0] == key[0]]:
+            del _GENRE_BG_CACHE[old_key]
+        _GENRE_BG_CACHE[key] = background
+    return background
+
+def _line_spacing(font) -> int:
+    """Gap between stacked cover text lines, proportional to the font size"""
+    return max(5, getattr(font, 'size', 80) // 16)
+
+@functools.lru_cache(maxsize=4096)
+def _text_bbox(font, text: str) -> tuple:
+    """font.getbbox(text), memoized for the long-lived fonts from _load_font"""
+    return font.getbbox(text)
+
+def _measure_text_block(font, lines: tuple, cached: bool = False):
+    """(width, height, left, top) of the ink box of lines stacked at the origin.
+    Pass cached=True only for fonts that outlive the call (see _text_bbox).
+    """
+    getbbox = functools.partial(_text_bbox, font) if cached else font.getbbox
+    spacing = _line_spacing(font)
+    left = top = right = bottom = None
+    y = 0
+    for line in lines:
+        x0, y0, x1, y1 = getbbox(line)
+        left = x0 if left is None else min(left, x0)
+        right = x1 if right is None else max(right, x1)
+        top = y + y0 if top is None else top
+        bottom = y + y1
+        y += y1 + spacing
+    return right - left, bottom - top, left, top
+
+@functools.lru_cache(maxsize=256)
+def _fit_font_size(base_font, lines: tuple, max_width: int, max_height: int,
+                   min_size: int = 20, max_size: int = 240) -> int:
+    """Binary-search the largest size of base_font's face whose text block
+    fits max_width x max_height. Memoized per font and text.
+    """
+    if not hasattr(base_font, 'font_variant'):
+        return getattr(base_font, 'size', min_size)
+    low, high = min_size, max_size
+    best = min_size
+    while low <= high:
+        size = (low + high) // 2
+        width, height, _, _ = _measure_text_block(base_font.font_variant(size=size), lines)
+        if width <= max_width and height <= max_height:
+            best = size
+            low = size + 1
+        else:
+            high = size - 1
+    return best
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font_paths: tuple, size: int, basic_layout: bool = True):
+    """First loadable TrueType font in font_paths at size, parsed once per process.
+    BASIC layout skips raqm shaping, which plain Latin text does not need.
+    """
+    layout_engine = ImageFont.Layout.BASIC if basic_layout else None
+    for font_path in font_paths:
+        try:
+            return ImageFont.truetype(font_path, size, layout_engine=layout_engine)
+        except OSError:
+            continue
+    
+    logging.getLogger('jellyjams').warning(f"No system font found, using default font at {size}pt")
+    return ImageFont.load_default()
+
+def _render_genre_cover(background_path: str, genre_name: str, destination: str) -> bool:
+    """Render "<GENRE> / RADIO" over the template and write it to destination.
+    Module-level with str arguments so it can be sent to a process pool; the
+    template and font caches live for the lifetime of each worker process.
+    Errors propagate to the caller.
+    """
+    # Background and font are shared by every genre cover in a batch
+    cover_size = _GENRE_COVER_SIZE
+    background = _load_genre_background(Path(background_path), cover_size).copy()
+    # Prepare text lines
+    line1 = genre_name.upper()
+    line2 = "RADIO"
+    
+    font = _load_font(_GENRE_FONT_PATHS, 400, line1.isascii())  # 5x bigger than original 80
+    
+    # Create drawing context
+    draw = ImageDraw.Draw(background)
+    
+    # Draw both lines centered on the cover with white color and a black
+    # outline for visibility; FreeType strokes the outline in the same pass
+    img_width, img_height = cover_size
+    draw.multiline_text(
+        (img_width // 2, img_height // 2), f"{line1}\n{line2}", font=font,
+        fill=(255, 255, 255), anchor="mm", align="center", spacing=20,
+        stroke_width=3, stroke_fill=(0, 0, 0)
+    )
+    
+    # Save the final image
+    _save_image_atomic(background, Path(destination))
+    return True
+
+# Blank working images keyed by (size, mode), reused across covers in a process
+_IMAGE_POOL: Dict[tuple, List] = {}
+_IMAGE_POOL_LOCK = threading.Lock()
+_IMAGE_POOL_PER_KEY = 4
+
+def _acquire_image(size: tuple, mode: str = 'RGB'):
+    """Blank (zeroed) image of size/mode from the pool, or a new one"""
+    with _IMAGE_POOL_LOCK:
+        free = _IMAGE_POOL.get((size, mode))
+        if free:
+            return free.pop()
+    return Image.new(mode, size, 0)
+
+def _release_image(img):
+    """Clear img and return it to the pool for the next cover"""
+    img.paste(0, (0, 0) + img.size)
+    with _IMAGE_POOL_LOCK:
+        free = _IMAGE_POOL.setdefault((img.size, img.mode), [])
+        if len(free) < _IMAGE_POOL_PER_KEY:
+            free.append(img)
+
+def _adaptive_text_color(image) -> tuple:
+    """Determine text color (black or white) based on background brightness"""
+    try:
+        # Sample the bottom fifth where text will be placed
+        width, height = image.size
+        box = (0, height - height // 5, width, height)
+        
+        # Flat areas (letterbox bars, solid backgrounds) have few distinct colors:
+        # weight their luminance by pixel count without building an array
+        colors = image.crop(box).getcolors(maxcolors=256)
+        if colors:
+            total = sum(count for count, _ in colors)
+            luminance = sum(count * (r * 77 + g * 150 + b * 29) for count, (r, g, b, *_) in colors) / (total * 256)
+        else:
+            # Photographic area: shrink to 16x16, a few hundred pixels are plenty
+            # for a light/dark decision
+            tile = image.resize((16, 16), Image.Resampling.BILINEAR, box=box)
+            img_array = np.asarray(tile.convert('RGB'), dtype=np.uint16)
+            
+            # Luminance with 8-bit fixed point weights (0.299, 0.587, 0.114 x 256)
+            luminance = ((img_array[..., 0] * 77 + img_array[..., 1] * 150 + img_array[..., 2] * 29) >> 8).mean()
+        
+        # Return white text for dark backgrounds, black for light backgrounds
+        if luminance < 128:
+            return (255, 255, 255)  # White text
+        else:
+            return (0, 0, 0)  # Black text
+    
+    except Exception as e:
+        logging.getLogger('jellyjams').debug(f"Error calculating adaptive text color: {e}")
+        # Default to white text with shadow
+        return (255, 255, 255)
+
+def _render_artist_cover(source_image: bytes, artist_text: str, destination: str) -> bool:
+    """Render "This is / <artist_text>" over the artist image and write it to destination.
+    Module-level so it can run in the cover process pool; errors propagate.
+    """
+    final_img = None
+    try:
+        # Open the source image
+        with Image.open(BytesIO(source_image)) as img:
+            # Convert to RGB if needed
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            
+            # Resize to smaller cover art size (350x350) for better text proportion;
+            # img is private to this call so it can be shrunk in place
+            cover_img = img
+            cover_img.thumbnail((350, 350), Image.Resampling.LANCZOS)
+            
+            # Take a black 350x350 image from the pool and center the cover on it
+            final_img = _acquire_image((350, 350), 'RGB')
+            
+            # Calculate position to center the image
+            x = (350 - cover_img.width) // 2
+            y = (350 - cover_img.height) // 2
+            final_img.paste(cover_img, (x, y))
+            
+            # Create drawing context
+            draw = ImageDraw.Draw(final_img)
+            
+            # Determine text color based on background brightness
+            text_color = _adaptive_text_color(final_img)
+            
+            # Define the text lines for "This is [Artist]" overlay
+            line1 = "This is"
+            line2 = artist_text
+            lines = (line1, line2)
+            
+            # Largest font size (up to 3x the 80pt base) whose text block fits
+            # inside the margins, rendered straight onto the cover
+            base_font = _load_font(_ARTIST_FONT_PATHS, 80, line2.isascii())
+            font_size = _fit_font_size(base_font, lines, 350 - 40, 350 - 40)
+            font = _load_font(_ARTIST_FONT_PATHS, font_size, line2.isascii())
+            
+            # Place the text block bottom left with a 20px left / 30px bottom margin
+            width, height, left, top = _measure_text_block(font, lines, cached=True)
+            paste_x = 20 - left
+            paste_y = max(10, 350 - height - 30) - top
+            line_step = _text_bbox(font, line1)[3] + _line_spacing(font)
+            
+            draw.text((paste_x, paste_y), line1, fill=text_color, font=font)
+            draw.text((paste_x, paste_y + line_step), line2, fill=text_color, font=font)
+            
+            # Save the final image in the format of the destination extension (COVER_FORMAT)
+            _save_image_atomic(final_img, Path(destination))
+            return True
+    finally:
+        if final_img is not None:
+            _release_image(final_img)
+
+class HttpCache:
+    """Persistent store of Jellyfin GET responses keyed by URL + params.
+    Entries keep the ETag/Last-Modified validators so repeat requests can be
+    answered with a cheap 304 instead of re-sending the full JSON body.
+    """
+    
+    def __init__(self, db_path: str, logger):
+        self.db_path = Path(db_path)
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disabled = not SQLITE_AVAILABLE
+    
+    def _connect(self):
+        if self._conn is None and not self._disabled:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                # Shared by the generator thread pool; access is serialized by self._lock
+                self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+                self._conn.execute(
+                    'CREATE TABLE IF NOT EXISTS responses ('
+                    'key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, stored REAL)'
+                )
+                self._conn.commit()
+            except Exception as e:
+                self.logger.warning(f"HTTP cache unavailable ({self.db_path}): {e}")
+                self._disabled = True
+                self._conn = None
+        return self._conn
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        raw = url + '?' + '&'.join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str):
+        """Return (etag, last_modified, body) for key, or None"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                return conn.execute(
+                    'SELECT etag, last_modified, body FROM responses WHERE key = ?', (key,)
+                ).fetchone()
+            except Exception as e:
+                self.logger.debug(f"HTTP cache read failed: {e}")
+                return None
+    
+    def put(self, key: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, etag, last_modified, body, stored) VALUES (?, ?, ?, ?, ?)',
+                    (key, etag, last_modified, body, time.time())
+                )
+                conn.commit()
+            except Exception as e:
+                self.logger.debug(f"HTTP cache write failed: {e}")
+
 class Config:
     def __init__(self):
         # Set constants
@@ -69,6 +680,12 @@ class Config:
         self.log_level = os.getenv('LOG_LEVEL', 'INFO')
         # Media library scan after playlist creation
         self.trigger_library_scan = os.getenv('TRIGGER_LIBRARY_SCAN', 'true').lower() == 'true'
+        # Maximum number of Jellyfin API requests in flight at once
+        self.jellyfin_max_concurrency = max(1, int(os.getenv('JELLYFIN_MAX_CONCURRENCY', '8')))
+        # Number of users whose personalized playlists are generated in parallel
+        self.personal_workers = max(1, int(os.getenv('PERSONAL_WORKERS', '8')))
+        # Image format for covers JellyJams writes (webp or jpeg)
+        self.cover_format = os.getenv('COVER_FORMAT', 'webp').lower()
         
         # Set default values for web UI configurable variables
         self.generation_interval = 24
@@ -114,14 +731,24 @@ class Config:
         # Load web UI settings if they exist (these override environment variables)
         self.load_web_ui_settings()
     
+    @property
+    def cover_extension(self) -> str:
+        """File extension matching cover_format (unknown formats fall back to WebP)"""
+        if self.cover_format in ('jpg', 'jpeg'):
+            return COVER_FORMATS['jpeg'][0]
+        return COVER_FORMATS['webp'][0]
+    
     def load_web_ui_settings(self):
         """Load settings from web UI JSON file - these take precedence over environment variables"""
         config_file = '/data/config/settings.json'
         try:
-            if Path(config_file).exists():
+            # Open directly rather than checking exists() first: one syscall on the common path
+            try:
                 with open(config_file, 'r') as f:
                     web_settings = json.load(f)
-                    
+            except FileNotFoundError:
+                web_settings = None
+            if web_settings is not None:
                 # Apply web UI settings (override environment variables)
                 if 'jellyfin_url' in web_settings:
                     self.jellyfin_url = web_settings['jellyfin_url']
@@ -149,6 +776,8 @@ class Config:
                     self.spotify_client_secret = web_settings['spotify_client_secret']
                 if 'spotify_cover_art_enabled' in web_settings:
                     self.spotify_cover_art_enabled = bool(web_settings['spotify_cover_art_enabled'])
+                if 'cover_format' in web_settings:
+                    self.cover_format = str(web_settings['cover_format']).lower()
                 
                 # User configuration for personalized playlists
                 if 'personal_playlist_users' in web_settings:
@@ -377,6 +1006,8 @@ class Config:
 class SpotifyClient:
     """Spotify API client for downloading cover art"""
     
+    MANIFEST_SWEEP_INTERVAL = 24 * 60 * 60  # seconds between stale-entry sweeps
+    
     def __init__(self, config: Config, logger):
         self.config = config
         self.logger = logger
@@ -394,8 +1025,93 @@ class SpotifyClient:
             'initialization_success': False,
             'initialization_attempts': 0
         }
+        # Manifest of downloaded covers so repeat runs skip the per-artist stat probe
+        self._manifest_path = Path('/data/config/covers_manifest.json')
+        self._manifest = {}
+        # Entries added (or removed, as None) since the last save, merged into the file on save
+        self._manifest_changes = {}
+        self._manifest_swept = False
+        self._manifest_lock = threading.Lock()
+        self._load_manifest()
         self._initialize_client()
     
+    def _load_manifest(self):
+        """Load the covers manifest and sweep entries whose file has disappeared"""
+        try:
+            with open(self._manifest_path, 'r') as f:
+                data = json.load(f)
+            self._manifest = data.get('covers', {})
+            last_sweep = data.get('last_sweep', 0)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.logger.warning(f"Could not load covers manifest, starting fresh: {e}")
+            self._manifest = {}
+            return
+        
+        # Periodic sweep: drop entries for covers that were removed from disk
+        if time.time() - last_sweep > self.MANIFEST_SWEEP_INTERVAL:
+            stale = [artist for artist, entry in self._manifest.items()
+                     if not os.path.exists(entry.get('path', ''))]
+            for artist in stale:
+                del self._manifest[artist]
+                self._manifest_changes[artist] = None
+            if stale:
+                self.logger.debug(f"Removed {len(stale)} stale entries from covers manifest")
+            self._manifest_swept = True
+    
+    def save_manifest(self):
+        """Persist the covers manifest if it changed.
+        Called at the end of each generation run or cover update batch. Changes are
+        merged into the current file, so clients in other processes do not lose theirs.
+        """
+        with self._manifest_lock:
+            if not (self._manifest_changes or self._manifest_swept):
+                return
+            try:
+                try:
+                    with open(self._manifest_path, 'r') as f:
+                        data = json.load(f)
+                    covers = data.get('covers', {})
+                    last_sweep = data.get('last_sweep', 0)
+                except FileNotFoundError:
+                    covers, last_sweep = {}, 0
+                for artist, entry in self._manifest_changes.items():
+                    if entry is None:
+                        covers.pop(artist, None)
+                    else:
+                        covers[artist] = entry
+                if self._manifest_swept:
+                    last_sweep = time.time()
+                data = {'last_sweep': last_sweep, 'covers': covers}
+                _atomic_write_bytes(self._manifest_path, json.dumps(data, indent=2).encode('utf-8'))
+                self._manifest = covers
+                self._manifest_changes = {}
+                self._manifest_swept = False
+            except Exception as e:
+                self.logger.debug(f"Could not save covers manifest: {e}")
+    
+    def _record_cover(self, artist_name: str, cover_path: Path):
+        """Remember a cover file for an artist in the manifest"""
+        try:
+            st = os.stat(cover_path)
+        except OSError:
+            return
+        with self._manifest_lock:
+            entry = {
+                'path': str(cover_path),
+                'size': st.st_size,
+                'mtime': st.st_mtime
+            }
+            self._manifest[artist_name] = entry
+            self._manifest_changes[artist_name] = entry
+    
+    def forget_cover_art(self, artist_name: str):
+        """Drop an artist from the manifest (e.g. after its playlist folder was deleted)"""
+        with self._manifest_lock:
+            if self._manifest.pop(artist_name, None) is not None:
+                self._manifest_changes[artist_name] = None
+    
     def _initialize_client(self):
         self.stats['initialization_attempts'] += 1
         
@@ -501,12 +1217,11 @@ class SpotifyClient:
             image_url = playlist_info['images'][0]['url']
             
             # Download the image
-            import requests
             response = requests.get(image_url, timeout=10)
             response.raise_for_status()
             
             # Save to file
-            Image.open(BytesIO(response.content)).save(save_path)
+            _save_image_atomic(Image.open(BytesIO(response.content)), save_path)
             
             self.logger.info(f"Downloaded Spotify cover art: {save_path}")
             return True
@@ -522,19 +1237,24 @@ class SpotifyClient:
             self.logger.debug(f"Spotify client not available for getting cover art for: {artist_name}")
             return False
             
-        import time
         start_time = time.time()
         self.stats['total_attempts'] += 1
-        exts = ['.jpg', '.jpeg', '.png', '.webp', '.bmp', '.avif']
         
         try:
-            # Check if cover art already exists
-            for ext in exts:
-                cover_path = playlist_dir / f"cover{ext}"
-                if cover_path.exists():
-                    self.logger.debug(f"Cover art already exists for {artist_name}")
-                    self.stats['successful_downloads'] += 1
-                    return True
+            # Check the manifest first; it avoids a stat per extension on slow volumes
+            entry = self._manifest.get(artist_name)
+            if entry and entry.get('size', 0) > 0 and Path(entry.get('path', '')).parent == playlist_dir:
+                self.logger.debug(f"Cover art already exists for {artist_name} (manifest)")
+                self.stats['successful_downloads'] += 1
+                return True
+            
+            # Check if cover art already exists (one directory read, any case)
+            cover_path = _find_existing_cover(playlist_dir)
+            if cover_path is not None:
+                self.logger.debug(f"Cover art already exists for {artist_name}")
+                self._record_cover(artist_name, cover_path)
+                self.stats['successful_downloads'] += 1
+                return True
             
             # Search for Spotify playlist
             playlist_info = self.search_artist_playlist(artist_name)
@@ -543,7 +1263,10 @@ class SpotifyClient:
                 return False
             
             # Download cover art
-            success = self.download_cover_art(playlist_info, str(playlist_dir / "cover.webp"))
+            cover_path = playlist_dir / f"cover{self.config.cover_extension}"
+            success = self.download_cover_art(playlist_info, str(cover_path))
+            if success:
+                self._record_cover(artist_name, cover_path)
             
             # Track statistics
             response_time = time.time() - start_time
@@ -566,8 +1289,6 @@ class SpotifyClient:
     
     def test_connection(self) -> dict:
         """Test Spotify API connection and return results"""
-        import time
-        from datetime import datetime
         
         test_result = {
             'success': False,
@@ -690,6 +1411,20 @@ def setup_logging(config: Config):
     return logger
 
 class JellyfinAPI:
+    # Retry policy for transient Jellyfin failures
+    MAX_ATTEMPTS = 5
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'DELETE'})
+    BACKOFF_BASE = 0.5   # seconds
+    BACKOFF_MAX = 30.0   # seconds
+    USERS_CACHE_TTL = 300  # seconds
+    PLAYLIST_BATCH_SIZE = 200  # track ids per playlist create/add request
+    CONNECTION_TEST_TIMEOUT = 10  # seconds
+    # Optional ItemFields actually read downstream. Id, Name, Album, Artists,
+    # ProductionYear and RunTimeTicks are part of every item DTO already.
+    FIELDS_FOR_LIBRARY = 'Genres,Path'   # Path locates artist folders for cover art
+    FIELDS_FOR_USER_ITEMS = 'Genres'
+
     def __init__(self, config: Config, logger: logging.Logger):
         self.config = config
         self.logger = logger
@@ -698,24 +1433,187 @@ class JellyfinAPI:
             'X-Emby-Token': config.api_key,
             'Content-Type': 'application/json'
         })
+        # Size the keep-alive pool for the concurrent prefetch so connections are
+        # reused instead of discarded. The adapter itself never retries: all retries
+        # with backoff live in _request, so attempts do not multiply.
+        pool_size = max(10, config.jellyfin_max_concurrency)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_size,
+            max_retries=0
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Bounds the number of requests in flight across all threads
+        self._sem = threading.BoundedSemaphore(config.jellyfin_max_concurrency)
+        # Conditional-GET cache shared across runs and processes
+        self._http_cache = HttpCache('/data/cache/http_cache.db', logger)
+        # Genre bitmask index over the last library passed to get_similar_tracks_by_genre
+        self._genre_index = None
+        self._genre_index_lock = threading.Lock()
+        # /Users rarely changes; cache it and the user playlists default to
+        self._users_cache = None
+        self._users_ts = 0.0
+        self._default_user = None
+        # Per-user index of existing playlists: normalized lowercase name -> playlist id
+        self._playlist_index = {}
+        self._playlist_index_lock = threading.Lock()
+
+    def _retry_delay(self, attempt: int, response=None) -> float:
+        """Seconds to wait before the next attempt: Retry-After if given, else exponential backoff with jitter"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.BACKOFF_MAX)
+                except ValueError:
+                    pass
+            if response.headers.get('X-RateLimit-Remaining') == '0':
+                reset = response.headers.get('X-RateLimit-Reset')
+                try:
+                    return min(max(float(reset) - time.time(), 0.0), self.BACKOFF_MAX)
+                except (TypeError, ValueError):
+                    pass
+        delay = self.BACKOFF_BASE * (2 ** attempt)
+        return min(delay + random.uniform(0, delay), self.BACKOFF_MAX)
+
+    def _should_retry_status(self, method: str, response: requests.Response) -> bool:
+        """Whether a response status is safe to retry for this method.
+        A 502/504 from a proxy may arrive after Jellyfin already handled a POST.
+        """
+        status = response.status_code
+        if status not in self.RETRY_STATUS_CODES:
+            return False
+        if method in self.IDEMPOTENT_METHODS:
+            return True
+        return status == 429 or (status == 503 and 'Retry-After' in response.headers)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the shared session with bounded concurrency and retries.
+        Idempotent methods are retried on rate limiting (429), gateway errors, connection
+        errors and timeouts. Other methods are retried only on 429 or a 503 carrying
+        Retry-After, which the server sends before doing any work, so a playlist is never
+        created twice.
+        """
+        method = method.upper()
+        for attempt in range(self.MAX_ATTEMPTS):
+            last_attempt = attempt == self.MAX_ATTEMPTS - 1
+            try:
+                with self._sem:
+                    response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if last_attempt or method not in self.IDEMPOTENT_METHODS:
+                    raise
+                delay = self._retry_delay(attempt)
+                self.logger.debug(f"{method} {url} failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            
+            if last_attempt or not self._should_retry_status(method, response):
+                return response
+            
+            delay = self._retry_delay(attempt, response)
+            self.logger.debug(f"{method} {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+
+    def _get_json(self, url: str, params: Optional[Dict] = None, **kwargs):
+        """GET a JSON endpoint, revalidating a cached copy with If-None-Match/If-Modified-Since.
+        Servers that send neither ETag nor Last-Modified are simply not cached.
+        """
+        key = HttpCache.make_key(url, params)
+        cached = self._http_cache.get(key)
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        response = self._request('GET', url, params=params, headers=headers, **kwargs)
+        if response.status_code == 304 and cached:
+            self.logger.debug(f"Using cached response for {url} (304 Not Modified)")
+            return _json_loads(cached[2])
+        response.raise_for_status()
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self._http_cache.put(key, etag, last_modified, response.content)
+        return _parse_json(response)
+
+    def _get_audio_names(self, endpoint: str) -> List[str]:
+        """Names from an aggregate endpoint (MusicGenres, Artists, Years) limited to audio items.
+        One row per distinct value instead of one per track; errors propagate to the caller.
+        """
+        url = f"{self.config.jellyfin_url}/{endpoint}"
+        params = {
+            'IncludeItemTypes': 'Audio',
+            'Recursive': 'true',
+            'EnableImages': 'false',
+            'EnableTotalRecordCount': 'false'
+        }
+        data = self._get_json(url, params=params)
+        return [item['Name'] for item in data.get('Items', []) if item.get('Name')]
+
+    def get_genres(self) -> List[str]:
+        """Distinct genre names of the audio library.
+        Audio is tagged with MusicGenre items, which /Genres does not return without a library ParentId.
+        """
+        return self._get_audio_names('MusicGenres')
+
+    def get_artists(self) -> List[str]:
+        """Distinct artist names of the audio library (track artists and album artists)"""
+        return self._get_audio_names('Artists')
+
+    def get_years(self) -> List[int]:
+        """Distinct production years of the audio library"""
+        return [int(name) for name in self._get_audio_names('Years') if name.isdigit()]
+
+    def _get_audio_page(self, start_index: int, page_size: int) -> Dict:
+        """Fetch one page of audio items from Jellyfin"""
+        url = f"{self.config.jellyfin_url}/Items"
+        params = {
+            'IncludeItemTypes': 'Audio',
+            'Recursive': 'true',
+            'Fields': self.FIELDS_FOR_LIBRARY,
+            'EnableImages': 'false',
+            'EnableUserData': 'false',
+            'SortBy': 'SortName',
+            'SortOrder': 'Ascending',
+            'StartIndex': start_index,
+            'Limit': page_size
+        }
+        return self._get_json(url, params=params)
+
+    def iter_audio_items(self, page_size: int = 500):
+        """Yield the audio library in pages of up to page_size items.
+        The next page is requested in the background while the caller
+        processes the current one, so transfer and parsing overlap.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            data = self._get_audio_page(0, page_size)
+            total = data.get('TotalRecordCount', 0)
+            start_index = 0
+            while True:
+                items = _normalize_item_genres(data.get('Items', []))
+                start_index += len(items)
+                next_page = None
+                if items and start_index < total:
+                    next_page = executor.submit(self._get_audio_page, start_index, page_size)
+                if items:
+                    yield items
+                if next_page is None:
+                    break
+                data = next_page.result()
 
     def get_audio_items(self) -> List[Dict]:
         """Get all audio items from Jellyfin"""
         try:
-            url = f"{self.config.jellyfin_url}/Items"
-            params = {
-                'IncludeItemTypes': 'Audio',
-                'Recursive': 'true',
-                'Fields': 'Path,Genres,ProductionYear,Artists,RunTimeTicks,DateCreated',
-                'SortBy': 'SortName',
-                'SortOrder': 'Ascending'
-            }
-            
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            items = data.get('Items', [])
+            items = []
+            for page in self.iter_audio_items():
+                items.extend(page)
             
             self.logger.info(f"Retrieved {len(items)} audio items from Jellyfin")
             return items
@@ -725,13 +1623,14 @@ class JellyfinAPI:
             return []
 
     def test_connection(self) -> bool:
-        """Test connection to Jellyfin API"""
+        """Test connection to Jellyfin API (a single attempt, so an unreachable server fails fast)"""
         try:
             url = f"{self.config.jellyfin_url}/System/Info"
-            response = self.session.get(url)
+            with self._sem:
+                response = self.session.get(url, timeout=self.CONNECTION_TEST_TIMEOUT)
             response.raise_for_status()
             
-            info = response.json()
+            info = _parse_json(response)
             self.logger.info(f"Connected to Jellyfin {info.get('Version', 'Unknown')} at {self.config.jellyfin_url}")
             return True
             
@@ -750,7 +1649,7 @@ class JellyfinAPI:
         headers = {"Accept": "image/webp,image/*;q=0.8,*/*;q=0.5"}
 
         try:
-            resp = self.session.get(url, params=params, headers=headers, timeout=timeout)
+            resp = self._request('GET', url, params=params, headers=headers, timeout=timeout)
             if resp.status_code == 404:
                 self.logger.info("Artist not found or no primary image: %r", artist_name)
                 return None
@@ -784,20 +1683,35 @@ class JellyfinAPI:
             raise
     
     def get_users(self) -> List[Dict]:
-        """Get all users from Jellyfin"""
+        """Get all users from Jellyfin (cached for USERS_CACHE_TTL seconds)"""
+        if self._users_cache is not None and (time.monotonic() - self._users_ts) < self.USERS_CACHE_TTL:
+            return self._users_cache
         try:
             url = f"{self.config.jellyfin_url}/Users"
-            response = self.session.get(url)
-            response.raise_for_status()
-            
-            users = response.json()
+            users = self._get_json(url)
             self.logger.info(f"Retrieved {len(users)} users from Jellyfin")
+            self._users_cache = users
+            self._users_ts = time.monotonic()
             return users
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error fetching users: {e}")
             return []
 
+    def refresh_users(self) -> List[Dict]:
+        """Drop the cached user list and default user, then fetch users again"""
+        self._users_cache = None
+        self._default_user = None
+        return self.get_users()
+
+    def _get_default_user(self) -> Optional[Dict]:
+        """First Jellyfin user, used when a call does not specify one"""
+        if self._default_user is None:
+            users = self.get_users()
+            if users:
+                self._default_user = users[0]
+        return self._default_user
+
     def get_user_listening_stats(self, user_id: str, limit: int = 100) -> List[Dict]:
         """Get user's most played tracks using Jellyfin's playback reporting"""
         try:
@@ -811,10 +1725,10 @@ class JellyfinAPI:
             }
             
             self.logger.debug(f"Attempting to get listening stats from: {url}")
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._request('GET', url, params=params, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if isinstance(data, list) and data:
                     self.logger.info(f"✅ Retrieved {len(data)} listening stats for user {user_id}")
                     return data
@@ -846,14 +1760,13 @@ class JellyfinAPI:
                 'IsFavorite': 'true',
                 'IncludeItemTypes': 'Audio',
                 'Recursive': 'true',
-                'Fields': 'Path,Genres,ProductionYear,Artists,RunTimeTicks,DateCreated,UserData'
+                'Fields': self.FIELDS_FOR_USER_ITEMS,
+                'EnableImages': 'false',
+                'EnableUserData': 'false'
             }
             
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            items = data.get('Items', [])
+            data = self._get_json(url, params=params)
+            items = _normalize_item_genres(data.get('Items', []))
             self.logger.info(f"Retrieved {len(items)} favorite tracks for user {user_id}")
             return items
             
@@ -871,14 +1784,17 @@ class JellyfinAPI:
                 'SortBy': 'DatePlayed',
                 'SortOrder': 'Descending',
                 'Limit': limit,
-                'Fields': 'Path,Genres,ProductionYear,Artists,RunTimeTicks,DateCreated,UserData'
+                'Fields': self.FIELDS_FOR_USER_ITEMS,
+                'EnableImages': 'false',
+                # UserData carries LastPlayedDate, used to drop never-played items
+                'EnableUserData': 'true'
             }
             
-            response = self.session.get(url, params=params)
+            response = self._request('GET', url, params=params)
             response.raise_for_status()
             
-            data = response.json()
-            items = data.get('Items', [])
+            data = _parse_json(response)
+            items = _normalize_item_genres(data.get('Items', []))
             # Filter only items that have been played
             played_items = [item for item in items if item.get('UserData', {}).get('LastPlayedDate')]
             self.logger.info(f"Retrieved {len(played_items)} recently played tracks for user {user_id}")
@@ -888,19 +1804,111 @@ class JellyfinAPI:
             self.logger.error(f"Error fetching recently played: {e}")
             return []
 
+    @staticmethod
+    def _track_genres(track: Dict) -> List[str]:
+        """Genres of a track, compared case-sensitively like the original set-based matching.
+        Genres are already a list of strings (see _normalize_item_genres).
+        """
+        return track.get('Genres') or []
+
+    def _get_genre_index(self, all_tracks: List[Dict]):
+        """Build (or reuse) the genre bitmask index for all_tracks.
+        Each track becomes a row of uint64 words with one bit per distinct genre.
+        The index is rebuilt whenever a different library list is passed in.
+        """
+        with self._genre_index_lock:
+            index = self._genre_index
+            if index is not None and index['tracks'] is all_tracks and index['count'] == len(all_tracks):
+                return index
+            return self._build_genre_index(all_tracks)
+    
+    def _build_genre_index(self, all_tracks: List[Dict]):
+        """Build the genre bitmask index (caller holds _genre_index_lock)"""
+        genre_to_bit = {}
+        track_bits = []
+        for track in all_tracks:
+            bits = []
+            for genre in self._track_genres(track):
+                bit = genre_to_bit.get(genre)
+                if bit is None:
+                    bit = genre_to_bit[genre] = len(genre_to_bit)
+                bits.append(bit)
+            track_bits.append(bits)
+        
+        words = max(1, (len(genre_to_bit) + 63) // 64)
+        masks = np.zeros((len(all_tracks), words), dtype=np.uint64)
+        for row, bits in enumerate(track_bits):
+            for bit in bits:
+                masks[row, bit >> 6] |= np.uint64(1 << (bit & 63))
+        
+        index = {
+            'tracks': all_tracks,
+            'count': len(all_tracks),
+            'genre_to_bit': genre_to_bit,
+            'masks': masks,
+            'ids': [track.get('Id') for track in all_tracks],
+        }
+        self._genre_index = index
+        return index
+
     def get_similar_tracks_by_genre(self, reference_tracks: List[Dict], all_tracks: List[Dict], limit: int = 50) -> List[Dict]:
         """Find similar tracks based on genre matching"""
         if not reference_tracks:
             return []
+        if not NUMPY_AVAILABLE:
+            return self._get_similar_tracks_by_genre_py(reference_tracks, all_tracks, limit)
         
+        index = self._get_genre_index(all_tracks)
+        genre_to_bit = index['genre_to_bit']
+        masks = index['masks']
+        
+        # Reference genres as a single mask; genres missing from the library still
+        # count towards the denominator, exactly like the set-based version
+        reference_genres = set()
+        for track in reference_tracks:
+            reference_genres.update(self._track_genres(track))
+        if not reference_genres:
+            return []
+        ref_mask = np.zeros(masks.shape[1], dtype=np.uint64)
+        for genre in reference_genres:
+            bit = genre_to_bit.get(genre)
+            if bit is not None:
+                ref_mask[bit >> 6] |= np.uint64(1 << (bit & 63))
+        
+        # Overlap per track = popcount(track_mask & ref_mask)
+        overlap = np.bitwise_count(masks & ref_mask).sum(axis=1, dtype=np.int64)
+        reference_ids = {track.get('Id') for track in reference_tracks}
+        if reference_ids:
+            overlap[[i for i, track_id in enumerate(index['ids']) if track_id in reference_ids]] = 0
+        
+        candidates = np.flatnonzero(overlap)
+        if candidates.size == 0:
+            return []
+        counts = overlap[candidates]
+        
+        # Select the top `limit` in O(N): everything above the cut-off score plus the
+        # earliest tracks tied at it, which is what a stable full sort would keep
+        if candidates.size > limit:
+            if limit <= 0:
+                return []
+            threshold = np.partition(counts, candidates.size - limit)[candidates.size - limit]
+            above = counts > threshold
+            tied = np.flatnonzero(counts == threshold)[:limit - int(above.sum())]
+            keep = np.sort(np.concatenate((np.flatnonzero(above), tied)))
+            candidates = candidates[keep]
+            counts = counts[keep]
+        
+        order = np.argsort(-counts, kind='stable')
+        total = len(reference_genres)
+        # Library tracks are shared between users generated in parallel; score copies
+        return [{**all_tracks[candidates[pos]], 'similarity_score': int(counts[pos]) / total} for pos in order]
+
+    def _get_similar_tracks_by_genre_py(self, reference_tracks: List[Dict], all_tracks: List[Dict], limit: int = 50) -> List[Dict]:
+        """Pure Python fallback for get_similar_tracks_by_genre when NumPy is unavailable"""
         # Extract genres from reference tracks
         reference_genres = set()
         for track in reference_tracks:
-            if track.get('Genres'):
-                if isinstance(track['Genres'], list):
-                    reference_genres.update(track['Genres'])
-                elif isinstance(track['Genres'], str):
-                    reference_genres.add(track['Genres'])
+            reference_genres.update(self._track_genres(track))
         
         # Find tracks with matching genres
         similar_tracks = []
@@ -910,19 +1918,11 @@ class JellyfinAPI:
             # Skip if it's already in reference tracks
             if track.get('Id') in reference_ids:
                 continue
-                
-            track_genres = set()
-            if track.get('Genres'):
-                if isinstance(track['Genres'], list):
-                    track_genres.update(track['Genres'])
-                elif isinstance(track['Genres'], str):
-                    track_genres.add(track['Genres'])
             
             # Calculate genre overlap
-            genre_overlap = len(reference_genres.intersection(track_genres))
+            genre_overlap = len(reference_genres.intersection(self._track_genres(track)))
             if genre_overlap > 0:
-                track['similarity_score'] = genre_overlap / len(reference_genres)
-                similar_tracks.append(track)
+                similar_tracks.append({**track, 'similarity_score': genre_overlap / len(reference_genres)})
         
         # Sort by similarity score and return top matches
         similar_tracks.sort(key=lambda x: x.get('similarity_score', 0), reverse=True)
@@ -933,37 +1933,43 @@ class JellyfinAPI:
         try:
             # If no user_id provided, get the first available user
             if not user_id:
-                users = self.get_users()
-                if not users:
+                default_user = self._get_default_user()
+                if not default_user:
                     raise Exception("No users found in Jellyfin")
-                user_id = users[0]['Id']
-                self.logger.info(f"Using user {users[0]['Name']} ({user_id}) for playlist creation")
+                user_id = default_user['Id']
+                self.logger.info(f"Using user {default_user['Name']} ({user_id}) for playlist creation")
             
-            # Create the playlist
+            # Create the playlist with the first batch of tracks; large playlists
+            # get the rest appended in batches so no single request grows unbounded
+            batch_size = self.PLAYLIST_BATCH_SIZE
             url = f"{self.config.jellyfin_url}/Playlists"
             payload = {
                 "Name": name,
                 "IsPublic": is_public,
-                "Ids": track_ids,
+                "Ids": track_ids[:batch_size],
                 "UserId": user_id
             }
             
             privacy_text = "public" if is_public else "private"
             self.logger.info(f"Creating {privacy_text} playlist '{name}' with {len(track_ids)} tracks for user {user_id}")
             
-            response = self.session.post(url, json=payload)
+            response = self._request('POST', url, data=_json_dumps(payload))
             response.raise_for_status()
             
-            playlist_data = response.json()
+            playlist_data = _parse_json(response)
             playlist_id = playlist_data.get('Id')
             
             self.logger.info(f"Successfully created {privacy_text} playlist '{name}' with ID: {playlist_id}")
             
+            track_count = min(len(track_ids), batch_size)
+            if len(track_ids) > batch_size and playlist_id:
+                track_count += self._add_playlist_items(playlist_id, track_ids[batch_size:], user_id)
+            
             return {
                 'success': True,
                 'playlist_id': playlist_id,
                 'name': name,
-                'track_count': len(track_ids),
+                'track_count': track_count,
                 'user_id': user_id,
                 'is_public': is_public
             }
@@ -986,26 +1992,129 @@ class JellyfinAPI:
                 'name': name
             }
 
+    def _add_playlist_items(self, playlist_id: str, track_ids: List[str], user_id: str) -> int:
+        """Append track_ids to a playlist in batches, in order. Returns the number added."""
+        url = f"{self.config.jellyfin_url}/Playlists/{playlist_id}/Items"
+        batch_size = self.PLAYLIST_BATCH_SIZE
+        total_batches = (len(track_ids) + batch_size - 1) // batch_size
+        added = 0
+        # Sequential on purpose: Jellyfin appends in request order
+        for batch_number, start in enumerate(range(0, len(track_ids), batch_size), 1):
+            batch = track_ids[start:start + batch_size]
+            try:
+                response = self._request('POST', url, params={'Ids': ','.join(batch), 'UserId': user_id})
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Error adding batch {batch_number}/{total_batches} to playlist {playlist_id}: {e}")
+                break
+            added += len(batch)
+            if batch_number % 5 == 0 or batch_number == total_batches:
+                self.logger.info(f"Added {added}/{len(track_ids)} additional tracks to playlist {playlist_id}")
+        return added
+
+    @staticmethod
+    def _playlist_key(name: str) -> str:
+        return normalize_name(name).lower()
+
+    def load_playlist_index(self, user_id: str = None) -> Dict[str, str]:
+        """Return the name -> id index of the user's playlists, fetching it once per batch"""
+        if not user_id:
+            default_user = self._get_default_user()
+            if not default_user:
+                return {}
+            user_id = default_user['Id']
+        
+        with self._playlist_index_lock:
+            index = self._playlist_index.get(user_id)
+            if index is not None:
+                return index
+        
+        # Fetch outside the lock so indexes for different users can load in parallel
+        url = f"{self.config.jellyfin_url}/Users/{user_id}/Items"
+        params = {
+            'IncludeItemTypes': 'Playlist',
+            'Recursive': 'true',
+            'EnableImages': 'false',
+            'EnableUserData': 'false'
+        }
+        response = self._request('GET', url, params=params)
+        response.raise_for_status()
+        
+        index = {}
+        for playlist in _parse_json(response).get('Items', []):
+            if playlist.get('Name') and playlist.get('Id'):
+                index[self._playlist_key(playlist['Name'])] = playlist['Id']
+        with self._playlist_index_lock:
+            # Another thread may have indexed this user meanwhile; keep the first copy
+            index = self._playlist_index.setdefault(user_id, index)
+        self.logger.debug(f"Indexed {len(index)} existing playlists for user {user_id}")
+        return index
+
+    def clear_playlist_index(self):
+        """Forget indexed playlists; call at the start of each generation batch"""
+        with self._playlist_index_lock:
+            self._playlist_index.clear()
+
+    def upsert_playlist(self, name: str, track_ids: List[str], user_id: str = None, is_public: bool = True) -> Dict:
+        """Create playlist `name`, replacing an existing one with the same name.
+        Uses the per-batch playlist index instead of a SearchTerm query per playlist.
+        The result is create_playlist's dict plus 'replaced' (an old playlist was deleted).
+        """
+        if not user_id:
+            default_user = self._get_default_user()
+            if default_user:
+                user_id = default_user['Id']
+        
+        key = self._playlist_key(name)
+        try:
+            index = self.load_playlist_index(user_id)
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Could not load playlist index, falling back to name search: {e}")
+            existing = self.get_playlist_by_name(name, user_id)
+            index = {key: existing['Id']} if existing else {}
+        
+        replaced = False
+        existing_id = index.get(key)
+        if existing_id:
+            self.logger.info(f"Playlist '{name}' already exists, attempting to delete old version with ID: {existing_id}")
+            if self.delete_playlist(existing_id):
+                replaced = True
+                with self._playlist_index_lock:
+                    index.pop(key, None)
+            else:
+                self.logger.info(f"🔄 Could not delete existing playlist (will create new version anyway)")
+        else:
+            self.logger.info(f"ℹ️ No existing playlist found with name: {name}")
+        
+        result = self.create_playlist(name, track_ids, user_id, is_public)
+        if result.get('success') and result.get('playlist_id'):
+            with self._playlist_index_lock:
+                index[key] = result['playlist_id']
+        result['replaced'] = replaced
+        return result
+
     def get_playlist_by_name(self, name: str, user_id: str = None) -> Dict:
         """Check if a playlist with the given name already exists"""
         try:
             if not user_id:
-                users = self.get_users()
-                if not users:
+                default_user = self._get_default_user()
+                if not default_user:
                     return None
-                user_id = users[0]['Id']
+                user_id = default_user['Id']
             
             url = f"{self.config.jellyfin_url}/Users/{user_id}/Items"
             params = {
                 'IncludeItemTypes': 'Playlist',
                 'Recursive': 'true',
-                'SearchTerm': name
+                'SearchTerm': name,
+                'EnableImages': 'false',
+                'EnableUserData': 'false'
             }
             
-            response = self.session.get(url, params=params)
+            response = self._request('GET', url, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = _parse_json(response)
             playlists = data.get('Items', [])
             
             # Look for exact name match (normalize Unicode quotes/apostrophes)
@@ -1024,7 +2133,7 @@ class JellyfinAPI:
         """Delete a playlist by ID"""
         try:
             url = f"{self.config.jellyfin_url}/Items/{playlist_id}"
-            response = self.session.delete(url)
+            response = self._request('DELETE', url)
             response.raise_for_status()
             
             self.logger.info(f"Successfully deleted playlist with ID: {playlist_id}")
@@ -1038,7 +2147,7 @@ class JellyfinAPI:
         """Trigger a media library scan in Jellyfin to refresh playlists"""
         try:
             url = f"{self.config.jellyfin_url}/Library/Refresh"
-            response = self.session.post(url)
+            response = self._request('POST', url)
             response.raise_for_status()
             
             self.logger.info("Successfully triggered Jellyfin media library scan")
@@ -1055,13 +2164,65 @@ class PlaylistGenerator:
         self.jellyfin = JellyfinAPI(config, logger)
         self.spotify = SpotifyClient(config, logger)
         # Add caching for API queries to prevent repeated expensive calls
-        self._artist_path_cache = {}
         self._audio_items_cache = None
         self._cache_timestamp = None
+        # Lowercase artist name -> artist folder, built from the cached audio items
+        self._artist_path_index: Optional[Dict[str, Path]] = None
+        self._artist_path_index_lock = threading.Lock()
+        # Index saved by the previous run, consulted before the library is fetched
+        self._artist_path_file = Path('/data/cache/artist_paths.json')
+        self._saved_artist_paths: Optional[Dict[str, str]] = None
+        # Artist folder -> first cover file in it (None if there is none), same lifetime
+        self._cover_file_cache: Dict[str, Optional[str]] = {}
+        # Exact genre -> tracks over the cached audio items, shared by every user's genre mix
+        self._tracks_by_genre: Optional[Dict] = None
+        self._tracks_by_genre_lock = threading.Lock()
+        # Per-run memo of per-user Jellyfin calls keyed by (kind, user_id, limit)
+        self._call_cache = {}
+        self._call_cache_lock = threading.Lock()
+        # Thread pool for cover art file I/O and image work, created on first use and
+        # shut down by wait_for_cover_art() so idle generators hold no threads
+        self._io_pool = None
+        self._io_futures = []
+        self._io_lock = threading.Lock()
+        # Index of /data/cover: lowercase stem -> Path, rebuilt when the directory changes
+        self._cover_index: Optional[Dict[str, Path]] = None
+        self._cover_index_mtime = None
+        self._cover_index_lock = threading.Lock()
+        # Worker processes for CPU-bound cover rendering (see _get_cpu_pool)
+        self._cpu_pool = None
 
+    def _submit_io(self, fn, *args):
+        """Run fn(*args) on the cover art I/O pool; wait_for_cover_art() collects the results"""
+        with self._io_lock:
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix='cover-io')
+            future = self._io_pool.submit(fn, *args)
+            self._io_futures.append(future)
+        return future
+    
+    def wait_for_cover_art(self):
+        """Block until all queued cover art work has finished, logging any failures"""
+        with self._io_lock:
+            futures, self._io_futures = self._io_futures, []
+        if futures:
+            self.logger.info(f"Waiting for {len(futures)} cover art tasks to finish...")
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"❌ Cover art task failed: {e}")
+        # The run's covers are on disk; record them for the next run
+        self.spotify.save_manifest()
+        # Nothing else will render until the next batch; release the threads and worker processes
+        with self._io_lock:
+            io_pool, self._io_pool = self._io_pool, None
+        if io_pool is not None:
+            io_pool.shutdown(wait=True)
+        self._shutdown_cpu_pool()
+    
     def _get_cached_audio_items(self) -> List[Dict]:
         """Get audio items with caching to prevent repeated expensive API calls"""
-        import time
         current_time = time.time()
         
         # Cache for 30 minutes during cover art updates to prevent repeated API calls
@@ -1074,16 +2235,59 @@ class PlaylistGenerator:
             self.logger.debug("📡 Fetching fresh audio items from Jellyfin API")
             self._audio_items_cache = self.jellyfin.get_audio_items()
             self._cache_timestamp = current_time
+            self._artist_path_index = None
+            self._cover_file_cache = {}
             self.logger.info(f"📋 Cached {len(self._audio_items_cache)} audio items for {cache_duration//60} minutes")
         else:
             self.logger.debug(f"📋 Using cached audio items ({len(self._audio_items_cache)} items, cached {int((current_time - self._cache_timestamp)/60)} minutes ago)")
         
         return self._audio_items_cache
 
+    COVER_SOURCE_DIR = Path("/data/cover")
+    # Preferred extension when several files share a stem
+    COVER_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.avif', '.bmp')
+    
+    def _scan_cover_dir(self) -> Dict[str, Path]:
+        """Return the cover directory index, rescanning only if the directory mtime changed"""
+        with self._cover_index_lock:
+            try:
+                mtime = self.COVER_SOURCE_DIR.stat().st_mtime_ns
+            except OSError:
+                self._cover_index, self._cover_index_mtime = None, None
+                return {}
+            if self._cover_index is not None and mtime == self._cover_index_mtime:
+                return self._cover_index
+            
+            priority = {ext: rank for rank, ext in enumerate(self.COVER_EXTENSIONS)}
+            index = {}
+            # scandir yields the file type with each entry, so no per-file stat is needed
+            with os.scandir(self.COVER_SOURCE_DIR) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    ext = ext.lower()
+                    if ext not in priority or not entry.is_file():
+                        continue
+                    stem = stem.lower()
+                    current = index.get(stem)
+                    if current is None or priority[ext] < priority[current.suffix.lower()]:
+                        index[stem] = Path(entry.path)
+            self._cover_index, self._cover_index_mtime = index, mtime
+            self.logger.debug(f"Indexed {len(index)} cover images in {self.COVER_SOURCE_DIR}")
+            return index
+    
+    def _find_cover_source(self, *names: str) -> Optional[Path]:
+        """First cover image in the cover directory matching one of names (case-insensitive)"""
+        index = self._scan_cover_dir()
+        for name in names:
+            path = index.get(name.lower())
+            if path is not None:
+                return path
+        return None
+    
     def copy_custom_cover_art(self, playlist_name: str, playlist_dir: Path) -> bool:
         """Copy custom cover art from /app/cover/ directory with fallback system and extension preservation"""
         try:
-            cover_source_dir = Path("/data/cover")
+            cover_source_dir = self.COVER_SOURCE_DIR
             self.logger.info(f"Looking for custom cover art for playlist: {playlist_name}")
             self.logger.info(f"Checking cover source directory: {cover_source_dir}")
             
@@ -1091,64 +2295,34 @@ class PlaylistGenerator:
                 self.logger.warning(f"Cover source directory does not exist: {cover_source_dir}")
                 return False
             
-            # List all files in cover directory for debugging
-            try:
-                cover_files = list(cover_source_dir.glob("*"))
-                self.logger.info(f"Found {len(cover_files)} files in cover directory: {[f.name for f in cover_files[:10]]}")  # Show first 10
-            except Exception as e:
-                self.logger.warning(f"Could not list cover directory contents: {e}")
-            
-            # Look for cover image with playlist name (try common extensions)
-            extensions = ['.jpg', '.jpeg', '.png', '.webp', '.avif', '.bmp']
-            source_image = None
-            found_extension = None
+            # List indexed cover files for debugging
+            if self.logger.isEnabledFor(logging.DEBUG):
+                cover_index = self._scan_cover_dir()
+                sample = [p.name for _, p in zip(range(10), cover_index.values())]  # Show first 10
+                self.logger.debug(f"Found {len(cover_index)} images in cover directory: {sample}")
             
             # First, try exact playlist name match
             self.logger.info(f"Trying exact match for: {playlist_name}")
-            for ext in extensions:
-                potential_file = cover_source_dir / f"{playlist_name}{ext}"
-                self.logger.debug(f"Checking: {potential_file}")
-                if potential_file.exists():
-                    source_image = potential_file
-                    found_extension = ext
-                    self.logger.info(f"Found exact match cover art: {potential_file}")
-                    break
+            source_image = self._find_cover_source(playlist_name)
+            if source_image:
+                self.logger.info(f"Found exact match cover art: {source_image}")
             
             # If no exact match, try fallback with playlist type + "all"
             if not source_image:
                 self.logger.info(f"No exact match found, trying fallback patterns...")
                 # Extract playlist type for fallback (e.g., "Top Tracks - all", "Discovery Mix - all")
                 fallback_patterns = []
-                
-                if "Top Tracks -" in playlist_name:
-                    fallback_patterns.append("Top Tracks - all")
-                elif "Discovery Mix -" in playlist_name:
-                    fallback_patterns.append("Discovery Mix - all")
-                elif "Recent Favorites -" in playlist_name:
-                    fallback_patterns.append("Recent Favorites - all")
-                elif "Genre Mix -" in playlist_name:
-                    fallback_patterns.append("Genre Mix - all")
-                elif "This is" in playlist_name:
-                    fallback_patterns.append("This is - all")
-                elif "Radio" in playlist_name:
-                    fallback_patterns.append("Radio - all")
-                elif "Back to" in playlist_name:
-                    fallback_patterns.append("Back to - all")
+                # A name can contain several markers (e.g. "Back to Basics Radio"); keep map priority
+                markers = FALLBACK_RE.findall(playlist_name)
+                if markers:
+                    fallback_patterns.append(FALLBACK_MAP[min(markers, key=_FALLBACK_PRIORITY.__getitem__)])
                 
                 self.logger.info(f"Trying fallback patterns: {fallback_patterns}")
                 
                 # Try fallback patterns
-                for pattern in fallback_patterns:
-                    for ext in extensions:
-                        potential_file = cover_source_dir / f"{pattern}{ext}"
-                        self.logger.debug(f"Checking fallback: {potential_file}")
-                        if potential_file.exists():
-                            source_image = potential_file
-                            found_extension = ext
-                            self.logger.info(f"Found fallback cover art: {potential_file}")
-                            break
-                    if source_image:
-                        break
+                source_image = self._find_cover_source(*fallback_patterns)
+                if source_image:
+                    self.logger.info(f"Found fallback cover art: {source_image}")
             
             if not source_image:
                 self.logger.info(f"No custom cover art found for playlist: {playlist_name} (tried exact match and fallback)")
@@ -1159,26 +2333,21 @@ class PlaylistGenerator:
             
             # Copy and rename to folder.[original_extension] in the playlist directory
             # Preserve the original extension but rename to "folder"
-            destination_filename = f"folder{found_extension}"
+            destination_filename = f"folder{source_image.suffix}"
             destination_image = playlist_dir / destination_filename
             
             self.logger.info(f"Copying cover art: {source_image} -> {destination_image}")
             
-            import shutil
-            shutil.copy2(source_image, destination_image)
+            _fast_copy(source_image, destination_image)
             
             # Ensure cover art is world-readable on host mounts
-            try:
-                os.chmod(destination_image, 0o664)
-            except Exception as chmod_err:
-                self.logger.debug(f"chmod failed for {destination_image}: {chmod_err}")
+            _ensure_world_readable(destination_image, self.logger)
             
             self.logger.info(f"Successfully copied custom cover art: {source_image} -> {destination_image}")
             return True
             
         except Exception as e:
             self.logger.error(f"Error copying custom cover art for {playlist_name}: {e}")
-            import traceback
             self.logger.error(f"Traceback: {traceback.format_exc()}")
             return False
     
@@ -1193,7 +2362,7 @@ class PlaylistGenerator:
             decade = playlist_name.replace("Back to the ", "").strip()
             self.logger.info(f"🗓️ Looking for decade-specific cover art for: {decade}")
             
-            cover_source_dir = Path("/data/cover")
+            cover_source_dir = self.COVER_SOURCE_DIR
             
             if not cover_source_dir.exists():
                 self.logger.warning(f"Cover source directory does not exist: {cover_source_dir}")
@@ -1202,17 +2371,9 @@ class PlaylistGenerator:
             # Look for decade-specific cover art files in multiple naming formats
             # playlist_name is like "Back to the 1990s.jpg"
             # Decade-only format is like "1990s-cover.jpg"
-            names = [playlist_name, f"{decade}-cover"]
-            exts = ['.jpg', '.jpeg', '.png', '.webp', '.bmp', '.avif']
-            
-            source_image = None
-            for base in names:
-                for ext in exts:
-                    candidate = cover_source_dir / f"{base}{ext}"
-                    if candidate.exists() and candidate.is_file():
-                        source_image = candidate
-                        self.logger.info(f"🖼️ Found decade cover art: {source_image}")
-                        break
+            source_image = self._find_cover_source(playlist_name, f"{decade}-cover")
+            if source_image:
+                self.logger.info(f"🖼️ Found decade cover art: {source_image}")
             
             # If no specific decade cover found, try fallback for pre-1900s music
             if not source_image and decade.endswith('s'):
@@ -1220,12 +2381,9 @@ class PlaylistGenerator:
                     decade_year = int(decade[:-1])  # Remove 's' and convert to int
                     if decade_year < 1900:
                         self.logger.info(f"🕰️ Decade {decade} is before 1900s, trying 1800s fallback...")
-                        for ext in exts:
-                            potential_fallback = cover_source_dir / f"1800s-cover{ext}"
-                            if potential_fallback.exists() and potential_fallback.is_file():
-                                source_image = potential_fallback
-                                self.logger.info(f"🖼️ Found 1800s fallback cover art: {source_image}")
-                                break
+                        source_image = self._find_cover_source("1800s-cover")
+                        if source_image:
+                            self.logger.info(f"🖼️ Found 1800s fallback cover art: {source_image}")
                 except ValueError:
                     self.logger.warning(f"Could not parse decade year from: {decade}")
             
@@ -1240,21 +2398,16 @@ class PlaylistGenerator:
             
             self.logger.info(f"📋 Copying decade cover art: {source_image} -> {destination_image}")
             
-            import shutil
-            shutil.copy2(source_image, destination_image)
+            _fast_copy(source_image, destination_image)
             
             # Ensure cover art is world-readable on host mounts
-            try:
-                os.chmod(destination_image, 0o664)
-            except Exception as chmod_err:
-                self.logger.debug(f"chmod failed for {destination_image}: {chmod_err}")
+            _ensure_world_readable(destination_image, self.logger)
             
             self.logger.info(f"✅ Successfully applied decade cover art: {source_image} -> {destination_image}")
             return True
             
         except Exception as e:
             self.logger.error(f"Error applying decade cover art for {playlist_name}: {e}")
-            import traceback
             self.logger.error(f"Traceback: {traceback.format_exc()}")
             return False
     
@@ -1263,23 +2416,16 @@ class PlaylistGenerator:
         try:
             self.logger.info(f"🎵 Looking for genre cover art for: {genre_name}")
             
-            cover_source_dir = Path("/data/cover")
+            cover_source_dir = self.COVER_SOURCE_DIR
             
             if not cover_source_dir.exists():
                 self.logger.warning(f"Cover source directory does not exist: {cover_source_dir}")
                 return False
             
             # First, try to find predefined genre cover art
-            names = [f"{genre_name} Radio", genre_name]
-            exts = ['.jpg', '.jpeg', '.png', '.webp', '.bmp', '.avif']
-            source_image = None
-            for base in names:
-                for ext in exts:
-                    potential_file = cover_source_dir / f"{base}{ext}"
-                    if potential_file.exists() and potential_file.is_file():
-                        source_image = potential_file
-                        self.logger.info(f"🖼️ Found predefined genre cover art: {source_image}")
-                        break
+            source_image = self._find_cover_source(f"{genre_name} Radio", genre_name)
+            if source_image:
+                self.logger.info(f"🖼️ Found predefined genre cover art: {source_image}")
             
             # If predefined cover found, copy it directly
             if source_image:
@@ -1289,14 +2435,10 @@ class PlaylistGenerator:
                 
                 self.logger.info(f"📋 Copying predefined genre cover art: {source_image} -> {destination_image}")
                 
-                import shutil
-                shutil.copy2(source_image, destination_image)
+                _fast_copy(source_image, destination_image)
                 
                 # Ensure cover art is world-readable on host mounts
-                try:
-                    os.chmod(destination_image, 0o664)
-                except Exception as chmod_err:
-                    self.logger.debug(f"chmod failed for {destination_image}: {chmod_err}")
+                _ensure_world_readable(destination_image, self.logger)
                 
                 self.logger.info(f"✅ Successfully applied predefined genre cover art: {source_image} -> {destination_image}")
                 return True
@@ -1304,20 +2446,16 @@ class PlaylistGenerator:
             # If no predefined cover found, generate one using "Fallback Radio.jpg" background
             self.logger.info(f"🎨 No predefined cover found, generating custom genre cover...")
             
-            background_image = None
-            for ext in exts:
-                potential_bg = cover_source_dir / f"Fallback Radio{ext}"
-                if potential_bg.exists() and potential_bg.is_file():
-                    background_image = potential_bg
-                    self.logger.info(f"🖼️ Found background template: {background_image}")
-                    break
+            background_image = self._find_cover_source("Fallback Radio")
+            if background_image:
+                self.logger.info(f"🖼️ Found background template: {background_image}")
             
             if not background_image:
                 self.logger.warning(f"❌ No 'Fallback Radio' background template found for genre cover generation")
                 return False
             
             # Generate custom genre cover with text overlay
-            destination_image = playlist_dir / "cover.webp"
+            destination_image = playlist_dir / f"cover{self.config.cover_extension}"
             success = self._generate_genre_cover_art(background_image, genre_name, destination_image)
             
             if success:
@@ -1329,97 +2467,52 @@ class PlaylistGenerator:
                 
         except Exception as e:
             self.logger.error(f"Error applying genre cover art for {playlist_name}: {e}")
-            import traceback
             self.logger.error(f"Traceback: {traceback.format_exc()}")
             return False
     
+    def _get_cpu_pool(self):
+        """Process pool for CPU-bound cover rendering, created on first use"""
+        with self._io_lock:
+            if self._cpu_pool is None:
+                # spawn: forking a process that holds thread pools and locks is unsafe
+                self._cpu_pool = ProcessPoolExecutor(
+                    max_workers=min(4, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._cpu_pool
+    
+    def _shutdown_cpu_pool(self):
+        with self._io_lock:
+            pool, self._cpu_pool = self._cpu_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+    
     def _generate_genre_cover_art(self, background_path: Path, genre_name: str, destination: Path) -> bool:
-        """Generate genre cover art with centered text overlay on background template"""
+        """Generate genre cover art with centered text overlay on background template.
+        Rendering runs in the process pool so it does not contend for the GIL with the
+        HTTP work; if the pool is unavailable it runs in this process instead.
+        """
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            
             self.logger.info(f"🎨 Generating genre cover art: {genre_name} on {background_path}")
-            
-            # Open and resize background image to standard size
-            with Image.open(background_path) as background:
-                # Convert to RGB if necessary
-                if background.mode != 'RGB':
-                    background = background.convert('RGB')
-                
-                # Resize to standard cover art size
-                cover_size = (600, 600)
-                background = background.resize(cover_size, Image.Resampling.LANCZOS)
-                
-                # Create drawing context
-                draw = ImageDraw.Draw(background)
-                
-                # Try to load a bold font, fallback to default
+            args = (str(background_path), genre_name, str(destination))
+            try:
+                future = self._get_cpu_pool().submit(_render_genre_cover, *args)
+            except Exception as pool_error:
+                self.logger.debug(f"Process pool unavailable, rendering in-process: {pool_error}")
+                _render_genre_cover(*args)
+            else:
                 try:
-                    # Try to find a system font
-                    font_size = 400  # 5x bigger than original 80
-                    font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-                except:
-                    try:
-                        # Alternative system font paths
-                        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-                    except:
-                        # Fallback to default font
-                        font = ImageFont.load_default()
-                        self.logger.warning("Using default font for genre cover art")
-                
-                # Prepare text lines
-                line1 = genre_name.upper()
-                line2 = "RADIO"
-                
-                # Get text dimensions for centering
-                bbox1 = draw.textbbox((0, 0), line1, font=font)
-                bbox2 = draw.textbbox((0, 0), line2, font=font)
-                
-                text1_width = bbox1[2] - bbox1[0]
-                text1_height = bbox1[3] - bbox1[1]
-                text2_width = bbox2[2] - bbox2[0]
-                text2_height = bbox2[3] - bbox2[1]
-                
-                # Calculate centered positions
-                img_width, img_height = cover_size
-                
-                # Position text in center with some spacing between lines
-                line_spacing = 20
-                total_text_height = text1_height + text2_height + line_spacing
-                
-                y_start = (img_height - total_text_height) // 2
-                
-                x1 = (img_width - text1_width) // 2
-                y1 = y_start
-                
-                x2 = (img_width - text2_width) // 2
-                y2 = y_start + text1_height + line_spacing
-                
-                # Draw text with white color and black outline for visibility
-                outline_width = 3
-                text_color = "white"
-                outline_color = "black"
-                
-                # Draw outline by drawing text in multiple positions
-                for adj_x in range(-outline_width, outline_width + 1):
-                    for adj_y in range(-outline_width, outline_width + 1):
-                        if adj_x != 0 or adj_y != 0:
-                            draw.text((x1 + adj_x, y1 + adj_y), line1, font=font, fill=outline_color)
-                            draw.text((x2 + adj_x, y2 + adj_y), line2, font=font, fill=outline_color)
-                
-                # Draw main text
-                draw.text((x1, y1), line1, font=font, fill=text_color)
-                draw.text((x2, y2), line2, font=font, fill=text_color)
-                
-                # Save the final image
-                background.save(destination, "JPEG", quality=85)
-                
-                self.logger.info(f"✅ Generated genre cover art: {destination}")
-                return True
+                    future.result()
+                except BrokenProcessPool as pool_error:
+                    self.logger.warning(f"Cover process pool failed ({pool_error}), rendering in-process")
+                    self._shutdown_cpu_pool()
+                    _render_genre_cover(*args)
+            
+            self.logger.info(f"✅ Generated genre cover art: {destination}")
+            return True
                 
         except Exception as e:
             self.logger.error(f"Error generating genre cover art: {e}")
-            import traceback
             self.logger.error(f"Traceback: {traceback.format_exc()}")
             return False
     
@@ -1440,7 +2533,7 @@ class PlaylistGenerator:
                 return False
             
             # Generate custom cover art with text overlay
-            destination_cover = playlist_dir / "folder.webp"
+            destination_cover = playlist_dir / f"folder{self.config.cover_extension}"
             success = self._generate_custom_cover_art(source_cover, artist_name, destination_cover)
             
             if success:
@@ -1449,21 +2542,17 @@ class PlaylistGenerator:
             else:
                 # Fallback to simple copy if text overlay fails
                 self.logger.warning("Text overlay failed, falling back to simple copy")
-                fallback_destination = playlist_dir / "folder.webp"
-                Image.open(BytesIO(source_cover)).save(fallback_destination)
+                fallback_destination = playlist_dir / f"folder{self.config.cover_extension}"
+                _save_image_atomic(Image.open(BytesIO(source_cover)), fallback_destination)
                 
                 # Ensure cover art is world-readable on host mounts
-                try:
-                    os.chmod(fallback_destination, 0o664)
-                except Exception as chmod_err:
-                    self.logger.debug(f"chmod failed for {fallback_destination}: {chmod_err}")
+                _ensure_world_readable(fallback_destination, self.logger)
                 
                 self.logger.info(f"✅ Fallback: copied artist folder cover art: {fallback_destination}")
                 return True
             
         except Exception as e:
             self.logger.error(f"❌ Error in artist folder fallback for {playlist_name}: {e}")
-            import traceback
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
             return False
     
@@ -1482,91 +2571,136 @@ class PlaylistGenerator:
             return self._find_cover_in_directory(artist_path)
         return None
     
+    def _build_artist_path_index(self, audio_items: List[Dict]) -> Dict[str, Path]:
+        """Map each lowercase artist name to its folder in one pass over the library.
+        Typical structure is /music/Artist/Album/Track.mp3, sometimes
+        /music/Artist/Track.mp3; the first track that matches wins.
+        """
+        index = {}
+        for item in audio_items:
+            artists = item.get('Artists')
+            file_path = item.get('Path')
+            if not artists or not file_path or not isinstance(artists, list):
+                continue
+            
+            parent = Path(file_path).parent
+            grandparent = parent.parent
+            parent_name = parent.name.lower()
+            grandparent_name = grandparent.name.lower()
+            for artist in artists:
+                key = artist.lower()
+                if key in index:
+                    continue
+                if key == grandparent_name:
+                    index[key] = grandparent
+                elif key == parent_name:
+                    index[key] = parent
+        return index
+    
+    def _load_saved_artist_paths(self) -> Dict[str, str]:
+        """Artist folder index persisted by a previous run ({} if there is none)"""
+        if self._saved_artist_paths is None:
+            try:
+                self._saved_artist_paths = _json_loads(self._artist_path_file.read_bytes()).get('artists', {})
+                self.logger.debug(f"📋 Loaded {len(self._saved_artist_paths)} saved artist folders")
+            except FileNotFoundError:
+                self._saved_artist_paths = {}
+            except Exception as e:
+                self.logger.debug(f"Could not load saved artist folders: {e}")
+                self._saved_artist_paths = {}
+        return self._saved_artist_paths
+    
+    def _save_artist_paths(self, index: Dict[str, Path]):
+        """Persist the artist folder index so the next run can skip the library fetch"""
+        artists = {name: str(path) for name, path in index.items()}
+        try:
+            _atomic_write_bytes(self._artist_path_file, _json_dumps({'saved': time.time(), 'artists': artists}))
+        except Exception as e:
+            self.logger.debug(f"Could not save artist folders: {e}")
+        self._saved_artist_paths = artists
+    
     def _get_artist_path_from_jellyfin(self, artist_name: str) -> Path:
-        """Get artist folder path from Jellyfin API with optimized caching"""
+        """Get artist folder path from the track paths Jellyfin reports"""
         try:
-            # Check cache first to avoid repeated expensive API calls
-            if artist_name in self._artist_path_cache:
-                cached_result = self._artist_path_cache[artist_name]
-                if cached_result is not None:
-                    self.logger.debug(f"📋 Using cached path for artist: {artist_name} -> {cached_result}")
-                else:
-                    self.logger.debug(f"📋 Using cached negative result for artist: {artist_name}")
-                return cached_result
-            
-            self.logger.debug(f"📡 Looking up artist path for: {artist_name}")
-            
-            # Get audio items from Jellyfin with caching - this should only happen once per session now
+            key = artist_name.lower()
+            with self._artist_path_index_lock:
+                index = self._artist_path_index
+                if index is None:
+                    # Warm start: trust a saved folder while it still exists
+                    saved = self._load_saved_artist_paths().get(key)
+                    if saved and os.path.isdir(saved):
+                        self.logger.debug(f"📁 Using saved artist directory: {saved}")
+                        return Path(saved)
+            
+            # Refresh the cached items first so a stale index gets dropped
             audio_items = self._get_cached_audio_items()
-            
-            # Look for tracks by this artist and extract the path
-            for item in audio_items:
-                if 'Artists' in item and isinstance(item['Artists'], list):
-                    for artist in item['Artists']:
-                        if artist.lower() == artist_name.lower():
-                            # Extract the directory path from the file path
-                            file_path = item.get('Path')
-                            if file_path:
-                                # Get the parent directory (should be artist folder)
-                                file_path_obj = Path(file_path)
-                                # Go up directories to find artist folder
-                                # Typical structure: /music/Artist/Album/Track.mp3
-                                potential_artist_dir = file_path_obj.parent.parent
-                                if potential_artist_dir.name.lower() == artist_name.lower():
-                                    self.logger.debug(f"📁 Found artist directory from track path: {potential_artist_dir}")
-                                    self._artist_path_cache[artist_name] = potential_artist_dir
-                                    self.logger.debug(f"📡 Got artist path from Jellyfin API: {potential_artist_dir}")
-                                    return potential_artist_dir
-                                # Sometimes it might be: /music/Artist/Track.mp3
-                                potential_artist_dir = file_path_obj.parent
-                                if potential_artist_dir.name.lower() == artist_name.lower():
-                                    self.logger.debug(f"📁 Found artist directory from track path: {potential_artist_dir}")
-                                    self._artist_path_cache[artist_name] = potential_artist_dir
-                                    self.logger.debug(f"📡 Got artist path from Jellyfin API: {potential_artist_dir}")
-                                    return potential_artist_dir
-        
-            self.logger.debug(f"❌ No artist folder found for: {artist_name}")
-            # Cache negative results too to prevent repeated failed lookups
-            self._artist_path_cache[artist_name] = None
+            with self._artist_path_index_lock:
+                if self._artist_path_index is None:
+                    self._artist_path_index = self._build_artist_path_index(audio_items)
+                    self.logger.debug(f"📋 Indexed {len(self._artist_path_index)} artist folders from track paths")
+                    self._save_artist_paths(self._artist_path_index)
+                index = self._artist_path_index
+            
+            artist_dir = index.get(key)
+            if artist_dir is not None:
+                self.logger.debug(f"📁 Found artist directory from track path: {artist_dir}")
+            else:
+                self.logger.debug(f"❌ No artist folder found for: {artist_name}")
+            return artist_dir
         
         except Exception as e:
             self.logger.debug(f"Error getting artist path from Jellyfin API: {e}")
-            # Cache negative results for errors too
-            self._artist_path_cache[artist_name] = None
-
+            return None
+    
+    def _scan_for_cover_file(self, directory_path: Path) -> Optional[str]:
+        """Top-down os.scandir walk (same order as os.walk) for the first cover file"""
+        pending = [str(directory_path)]
+        while pending:
+            current = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower() in _COVER_FILENAMES:
+                            return entry.path
+            except OSError:
+                continue
+            pending.extend(reversed(subdirs))
         return None
     
     def _find_cover_in_directory(self, directory_path: Path) -> Optional[bytes]:
-        pattern = re.compile(r"^(folder|cover|artist|thumb|front)\.(jpg|jpeg|png|webp|avif|bmp)$", re.IGNORECASE)
-        for root, dirs, files in os.walk(directory_path):
-            for fname in files:
-                if pattern.match(fname):
-                    self.logger.info(f"🖼️ Found cover art: {Path(root) / fname}")
-                    return (Path(root) / fname).read_bytes()
-        self.logger.debug(f"No cover art files found in: {directory_path}")
-        return None
+        key = str(directory_path)
+        with self._artist_path_index_lock:
+            cached = self._cover_file_cache.get(key, False)
+        if cached is False:
+            cached = self._scan_for_cover_file(directory_path)
+            with self._artist_path_index_lock:
+                self._cover_file_cache[key] = cached
+        
+        if cached is None:
+            self.logger.debug(f"No cover art files found in: {directory_path}")
+            return None
+        try:
+            data = Path(cached).read_bytes()
+        except OSError:
+            # Removed since it was found; forget it so the next call rescans
+            with self._artist_path_index_lock:
+                self._cover_file_cache.pop(key, None)
+            return None
+        self.logger.info(f"🖼️ Found cover art: {cached}")
+        return data
     
     def _sanitize_text_for_font(self, text: str) -> str:
         """Sanitize text to handle Unicode characters that cause font encoding errors"""
         try:
-            # Replace common Unicode characters that cause font issues
-            replacements = {
-                '\u2010': '-',  # Unicode hyphen → ASCII hyphen
-                '\u2011': '-',  # Non-breaking hyphen → ASCII hyphen
-                '\u2012': '-',  # Figure dash → ASCII hyphen
-                '\u2013': '-',  # En dash → ASCII hyphen
-                '\u2014': '-',  # Em dash → ASCII hyphen
-                '\u2015': '-',  # Horizontal bar → ASCII hyphen
-                '\u2018': "'", # Left single quotation mark → ASCII apostrophe
-                '\u2019': "'", # Right single quotation mark → ASCII apostrophe
-                '\u201C': '"',  # Left double quotation mark → ASCII quote
-                '\u201D': '"',  # Right double quotation mark → ASCII quote
-                '\u00A0': ' ',  # Non-breaking space → regular space
-            }
+            # Replace common Unicode characters that cause font issues in one pass
+            sanitized = text.translate(_FONT_SANITIZE_TABLE)
             
-            sanitized = text
-            for unicode_char, replacement in replacements.items():
-                sanitized = sanitized.replace(unicode_char, replacement)
+            # Plain ASCII needs no further checks
+            if sanitized.isascii():
+                return sanitized
             
             # Try to encode as latin-1 to catch any remaining problematic characters
             try:
@@ -1574,249 +2708,79 @@ class PlaylistGenerator:
                 return sanitized
             except UnicodeEncodeError:
                 # If still problematic, remove non-ASCII characters
-                sanitized = ''.join(char for char in sanitized if ord(char) < 128)
+                sanitized = sanitized.encode('ascii', 'ignore').decode('ascii')
                 self.logger.warning(f"Removed non-ASCII characters from artist name: {text} → {sanitized}")
                 return sanitized
                 
         except Exception as e:
             self.logger.warning(f"Error sanitizing text '{text}': {e}")
             # Fallback: remove all non-ASCII characters
-            return ''.join(char for char in text if ord(char) < 128)
+            return text.encode('ascii', 'ignore').decode('ascii')
+    
+    SAVE_PLAYLIST_WORKERS = 8  # concurrent save_playlist calls; Jellyfin requests stay capped by JELLYFIN_MAX_CONCURRENCY
     
     def _generate_custom_cover_art(self, source_image: bytes, artist_name: str, destination: Path) -> bool:
-        """Generate custom cover art with 'This is <artist>' text overlay using multi-stage scaling approach"""
+        """Generate custom cover art with 'This is <artist>' text overlay.
+        Rendering runs in the process pool; if the pool is unavailable it runs in this
+        process instead. There is no timeout: a queued render would count its wait in
+        line, and a running one cannot be stopped, so it would still overwrite any
+        fallback cover written in the meantime.
+        """
+        # Sanitize artist name to handle Unicode characters that fonts can't render
+        artist_text = self._sanitize_text_for_font(artist_name)
+        args = (source_image, artist_text, str(destination))
         try:
-            import signal
-            import time
-            
-            start_time = time.time()
-            
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Cover art generation timed out")
-            
-            # Set timeout to prevent worker crashes - reduced to 10 seconds for faster processing
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(10)  # 10 second timeout
-            
-            # Open the source image
-            with Image.open(BytesIO(source_image)) as img:
-                # Convert to RGB if needed
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Create a copy to work with
-                cover_img = img.copy()
-                
-                # Resize to smaller cover art size (350x350) for better text proportion
-                cover_img.thumbnail((350, 350), Image.Resampling.LANCZOS)
-                
-                # Create a new 350x350 image with the resized image centered
-                final_img = Image.new('RGB', (350, 350), (0, 0, 0))
-                
-                # Calculate position to center the image
-                x = (350 - cover_img.width) // 2
-                y = (350 - cover_img.height) // 2
-                final_img.paste(cover_img, (x, y))
-                
-                # Create drawing context
-                draw = ImageDraw.Draw(final_img)
-                
-                # Use extremely massive font size - 4x bigger again as requested (960pt)
-                font_size = 960  # Extremely massive font size for 350x350 canvas to match reference
-                font = None
-                
-                # Use a completely different approach - create large text by scaling
-                # Start with a reasonable font size that we know works, then scale the image
-                base_font_size = 80  # Use a size we know renders properly
-                font = None
-                
-                # Try to load a system font at base size
+            try:
+                future = self._get_cpu_pool().submit(_render_artist_cover, *args)
+            except Exception as pool_error:
+                self.logger.debug(f"Process pool unavailable, rendering in-process: {pool_error}")
+                _render_artist_cover(*args)
+            else:
                 try:
-                    # Try to find a system font
-                    system_fonts = [
-                        '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',  # Linux
-                        '/System/Library/Fonts/Helvetica.ttc',  # macOS
-                        'arial.ttf',  # Windows fallback
-                    ]
-                    
-                    for font_path in system_fonts:
-                        try:
-                            font = ImageFont.truetype(font_path, base_font_size)
-                            self.logger.debug(f"Using system font: {font_path} at {base_font_size}pt")
-                            break
-                        except:
-                            continue
-                            
-                except Exception as font_e:
-                    self.logger.warning(f"Could not load system fonts: {font_e}")
-                
-                # If no system font, try default
-                if font is None:
-                    try:
-                        font = ImageFont.load_default()
-                        self.logger.debug(f"Using default font at base size")
-                    except Exception:
-                        self.logger.error("Could not load any font")
-                        return False
-                
-                
-                # Determine text color based on background brightness
-                text_color = self._get_adaptive_text_color(final_img)
-                
-                # Define the text lines for "This is [Artist]" overlay
-                line1 = "This is"
-                # Sanitize artist name to handle Unicode characters that fonts can't render
-                line2 = self._sanitize_text_for_font(artist_name)
-                
-                # Calculate text dimensions on large canvas
-                if font:
-                    bbox1 = draw.textbbox((0, 0), line1, font=font)
-                    bbox2 = draw.textbbox((0, 0), line2, font=font)
-                    
-                    line1_width = bbox1[2] - bbox1[0]
-                    line1_height = bbox1[3] - bbox1[1]
-                    line2_width = bbox2[2] - bbox2[0]
-                    line2_height = bbox2[3] - bbox2[1]
-                    
-                    max_width = max(line1_width, line2_width)
-                    total_height = line1_height + line2_height + 5  # Minimum spacing between lines
-                else:
-                    # Fallback estimates
-                    line1_height = 80
-                    line2_height = 80
-                    total_height = 200
-                    max_width = 600
-                
-                # Create a large text canvas for high-quality text rendering
-                text_canvas_size = 1000  # Large canvas for high-quality text
-                text_img = Image.new('RGBA', (text_canvas_size, text_canvas_size), (0, 0, 0, 0))
-                text_draw = ImageDraw.Draw(text_img)
-                
-                # Position text on large canvas (centered for now, we'll position the final result)
-                text_x = 50  # Left margin on large canvas
-                start_y = (text_canvas_size - total_height) // 2
-                
-                line1_y = start_y
-                line2_y = start_y + line1_height + 5  # Minimum spacing between lines
-                
-                # Draw text on large canvas
-                text_draw.text((text_x, line1_y), line1, fill=text_color, font=font)
-                text_draw.text((text_x, line2_y), line2, fill=text_color, font=font)
-                
-                # Crop the text area to remove excess transparent space
-                bbox = text_img.getbbox()
-                if bbox:
-                    text_img = text_img.crop(bbox)
-                
-                # Scale the text to be much larger - this is where we get the massive size
-                scale_factor = 3.0  # Make text 3x larger
-                new_width = int(text_img.width * scale_factor)
-                new_height = int(text_img.height * scale_factor)
-                text_img = text_img.resize((new_width, new_height), Image.LANCZOS)
-                
-                # Position the scaled text on the final image (bottom left)
-                paste_x = 20  # Left margin
-                paste_y = 350 - new_height - 30  # Bottom alignment with margin
-                
-                # Ensure text fits within image bounds
-                if paste_y < 0:
-                    paste_y = 10
-                if paste_x + new_width > 350:
-                    # Scale down if too wide
-                    scale_factor = (350 - 40) / text_img.width
-                    new_width = int(text_img.width * scale_factor)
-                    new_height = int(text_img.height * scale_factor)
-                    text_img = text_img.resize((new_width, new_height), Image.LANCZOS)
-                    paste_y = 350 - new_height - 30
-                
-                # Paste the text onto the final image
-                final_img.paste(text_img, (paste_x, paste_y), text_img)
-                
-                # Save the final image as PNG
-                final_img.save(destination, 'webp')
-                
-                # Clear timeout
-                signal.alarm(0)
-                
-                self.logger.info(f" Generated custom cover art with text overlay: {line1} {line2}")
-                return True
+                    future.result()
+                except BrokenProcessPool as pool_error:
+                    self.logger.warning(f"Cover process pool failed ({pool_error}), rendering in-process")
+                    self._shutdown_cpu_pool()
+                    _render_artist_cover(*args)
+            
+            self.logger.info(f" Generated custom cover art with text overlay: This is {artist_text}")
+            return True
                 
-        except ImportError:
-            signal.alarm(0)  # Clear timeout
-            self.logger.error("❌ Pillow library not available. Install with: pip install Pillow")
-            return False
-        except TimeoutError:
-            signal.alarm(0)  # Clear timeout
-            self.logger.error("❌ Cover art generation timed out after 30 seconds")
-            return False
         except Exception as e:
-            signal.alarm(0)  # Clear timeout
             self.logger.error(f"❌ Error generating custom cover art: {e}")
-            import traceback
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
             return False
     
-    def _get_adaptive_text_color(self, image: 'Image') -> tuple:
-        """Determine text color (black or white) based on background brightness"""
-        try:
-            # Sample the bottom area where text will be placed
-            bottom_area = image.crop((0, 480, 600, 600))  # Bottom 120px
-            
-            # Calculate average brightness
-            import numpy as np
-            img_array = np.array(bottom_area)
-            
-            # Calculate luminance using standard formula
-            luminance = np.mean(img_array[:, :, 0] * 0.299 + 
-                              img_array[:, :, 1] * 0.587 + 
-                              img_array[:, :, 2] * 0.114)
-            
-            # Return white text for dark backgrounds, black for light backgrounds
-            if luminance < 128:
-                return (255, 255, 255)  # White text
-            else:
-                return (0, 0, 0)  # Black text
-                
-        except Exception as e:
-            self.logger.debug(f"Error calculating adaptive text color: {e}")
-            # Default to white text with shadow
-            return (255, 255, 255)
-
     def _apply_discovery_diversity_controls(self, tracks: List[Dict]) -> List[Dict]:
         """Apply diversity controls to discovery playlist: limit songs per album and per artist"""
         try:
-            album_counts = {}
-            artist_counts = {}
+            max_per_album = self.config.discovery_max_songs_per_album
+            max_per_artist = self.config.discovery_max_songs_per_artist
+            album_counts = defaultdict(int)
+            artist_counts = defaultdict(int)
             diverse_tracks = []
+            append = diverse_tracks.append
             
-            self.logger.info(f"Applying diversity controls: max {self.config.discovery_max_songs_per_album} per album, {self.config.discovery_max_songs_per_artist} per artist")
+            self.logger.info(f"Applying diversity controls: max {max_per_album} per album, {max_per_artist} per artist")
             
+            # Single ordered pass: a skipped track must not count towards the
+            # limits, so this stays sequential rather than a group-wise cumcount
             for track in tracks:
                 # Get album and artist info
                 album = track.get('Album', 'Unknown Album')
-                artists = track.get('Artists', ['Unknown Artist'])
+                artists = track.get('Artists', ('Unknown Artist',))
                 
-                # Check album limit
-                if album_counts.get(album, 0) >= self.config.discovery_max_songs_per_album:
+                # Check album limit, then artist limits for all artists on this track
+                if album_counts[album] >= max_per_album:
                     continue
-                
-                # Check artist limits for all artists on this track
-                artist_limit_exceeded = False
-                for artist in artists:
-                    if artist_counts.get(artist, 0) >= self.config.discovery_max_songs_per_artist:
-                        artist_limit_exceeded = True
-                        break
-                
-                if artist_limit_exceeded:
+                if any(artist_counts[artist] >= max_per_artist for artist in artists):
                     continue
                 
-                # Track passes diversity checks, add it
-                diverse_tracks.append(track)
-                
-                # Update counts
-                album_counts[album] = album_counts.get(album, 0) + 1
+                # Track passes diversity checks, add it and update counts
+                append(track)
+                album_counts[album] += 1
                 for artist in artists:
-                    artist_counts[artist] = artist_counts.get(artist, 0) + 1
+                    artist_counts[artist] += 1
             
             self.logger.info(f"Diversity filtering: {len(tracks)} -> {len(diverse_tracks)} tracks (removed {len(tracks) - len(diverse_tracks)} for diversity)")
             return diverse_tracks
@@ -1835,46 +2799,30 @@ class PlaylistGenerator:
         SubElement(root, 'LocalTitle').text = playlist_name
         
         # Calculate total runtime
-        total_runtime = sum(track.get('RunTimeTicks', 0) for track in tracks)
+        total_runtime = sum(map(methodcaller('get', 'RunTimeTicks', 0), tracks))
         SubElement(root, 'RunningTime').text = str(total_runtime)
         
         # Get all unique genres
-        all_genres = set()
-        for track in tracks:
-            if track.get('Genres'):
-                # Parse genres - handle both list and semicolon-separated string formats
-                if isinstance(track['Genres'], list):
-                    for genre_item in track['Genres']:
-                        if isinstance(genre_item, str) and ';' in genre_item:
-                            # Split semicolon-separated genres
-                            all_genres.update([g.strip() for g in genre_item.split(';') if g.strip()])
-                        else:
-                            all_genres.add(genre_item)
-                elif isinstance(track['Genres'], str):
-                    # Handle string format with semicolons
-                    if ';' in track['Genres']:
-                        all_genres.update([g.strip() for g in track['Genres'].split(';') if g.strip()])
-                    else:
-                        all_genres.add(track['Genres'])
+        all_genres = set(_iter_genres(tracks))
         SubElement(root, 'Genres').text = '|'.join(sorted(all_genres))
         
         SubElement(root, 'PlaylistMediaType').text = 'Audio'
         
-        # Add playlist items
+        # Add playlist items (tracks without a path are skipped)
+        paths = [path for path in map(methodcaller('get', 'Path'), tracks) if path]
         playlist_items = SubElement(root, 'PlaylistItems')
-        for track in tracks:
-            if track.get('Path'):
-                playlist_item = SubElement(playlist_items, 'PlaylistItem')
-                SubElement(playlist_item, 'Path').text = track['Path']
+        for path in paths:
+            SubElement(SubElement(playlist_items, 'PlaylistItem'), 'Path').text = path
         
         # Add empty elements
         SubElement(root, 'Shares')
         SubElement(root, 'OwnerUserId').text = '00000000-0000-0000-0000-000000000000'
         
         # Format XML
-        rough_string = tostring(root, 'unicode')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent='  ')
+        if LXML_AVAILABLE:
+            return tostring(root, pretty_print=True, xml_declaration=True, encoding='utf-8').decode('utf-8')
+        indent(root, space='  ')
+        return tostring(root, encoding='unicode', xml_declaration=True)
 
     def _sanitize_playlist_name(self, name: str) -> str:
         """Sanitize playlist name to remove problematic characters"""
@@ -1882,16 +2830,11 @@ class PlaylistGenerator:
             return "Unknown Playlist"
         
         # Log original name for debugging
-        self.logger.debug(f"Original playlist name: {repr(name)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Original playlist name: {repr(name)}")
         
-        # Normalize Unicode punctuation and remove null bytes
-        sanitized = normalize_name(name)
-        sanitized = sanitized.replace('\x00', '').replace('\0', '')
-
-        # Normalize different types of hyphens and dashes to a standard hyphen
-        hyphen_variants = ['\u2010', '\u2011', '\u2012', '\u2013', '\u2014', '\u2015']
-        for variant in hyphen_variants:
-            sanitized = sanitized.replace(variant, '-')
+        # Normalize Unicode punctuation (quotes and hyphen/dash variants), then drop null bytes
+        sanitized = normalize_name(name).translate(_PLAYLIST_NAME_TABLE)
         
         # Ensure it's not empty after sanitization
         if not sanitized:
@@ -1909,12 +2852,118 @@ class PlaylistGenerator:
         the playlist and corresponding image are saved in the same directory.
           - Characters: \ / : * ? " < > | and ASCII control chars (0–31)
         """
-        invalid_chars = r'<>:"/\\|?*\x00-\x1F'
         # Replace invalid chars with a space
-        sanitized = re.sub(f"[{invalid_chars}]", " ", playlist_name).strip()
+        sanitized = _INVALID_DIR_CHARS_RE.sub(" ", playlist_name).strip()
         self.logger.info(f"🧹 Sanitized playlist sub-directory: '{sanitized}'")
         return sanitized.strip()
     
+    def _apply_cover_art(self, playlist_type: str, name: str, playlist_dir: Path) -> bool:
+        """Apply cover art to a freshly created playlist folder based on its type"""
+        # Handle cover art based on playlist type
+        cover_added = False
+        ptype = playlist_type.lower()
+        
+        # For personalized playlists, try custom cover art first
+        if ptype == "personal":
+            self.logger.info(f"Attempting to apply custom cover art for personalized playlist...")
+            cover_added = self.copy_custom_cover_art(name, playlist_dir)
+            if cover_added:
+                self.logger.info(f"✅ Applied custom cover art for personalized playlist: {name}")
+            else:
+                self.logger.info(f"No custom cover art found for personalized playlist: {name}")
+        
+        # For decade playlists, try decade-specific cover art
+        elif ptype == "decade" and "Back to the" in name:
+            self.logger.info(f"🗓️ Attempting to apply decade-specific cover art...")
+            cover_added = self._apply_decade_cover_art(name, playlist_dir)
+            if cover_added:
+                self.logger.info(f"✅ Applied decade-specific cover art for playlist: {name}")
+            else:
+                self.logger.info(f"❌ No decade-specific cover art found for playlist: {name}")
+        
+        # For genre playlists, try genre-specific cover art
+        elif ptype == "genre" and " Radio" in name:
+            # Extract genre name from "[Genre] Radio" format
+            genre_name = name.replace(" Radio", "").strip()
+            self.logger.info(f"🎵 Attempting to apply genre-specific cover art for: {genre_name}")
+            cover_added = self._apply_genre_cover_art(name, genre_name, playlist_dir)
+            if cover_added:
+                self.logger.info(f"✅ Applied genre-specific cover art for playlist: {name}")
+            else:
+                self.logger.info(f"❌ No genre-specific cover art found for playlist: {name}")
+    
+        # For artist playlists, try Spotify cover art first, then fallback to custom generation
+        self.logger.debug(f"🔍 Cover art check - cover_added: {cover_added}, 'This is' in name: {'This is' in name}, spotify enabled: {self.spotify.is_enabled()}")
+        self.logger.debug(f"🔍 Spotify client status: {self.spotify.spotify is not None}")
+        
+        if not cover_added and "This is" in name:
+            # Extract artist name from "This is [Artist]!" format
+            artist_name = name.replace("This is ", "").replace("!", "").strip()
+            self.logger.info(f"🎯 Extracted artist name: {artist_name}")
+            
+            # Try Spotify cover art first if enabled
+            if self.spotify.is_enabled():
+                self.logger.info(f"🎨 Attempting to apply Spotify cover art for artist playlist...")
+                if self.spotify.get_artist_cover_art(artist_name, playlist_dir):
+                    cover_added = True
+                    self.logger.info(f"✅ Applied Spotify cover art for artist playlist: {name}")
+                else:
+                    self.logger.info(f"❌ No Spotify cover art found for artist: {artist_name}")
+            else:
+                self.logger.info(f"⚠️ Spotify cover art skipped - Spotify enabled: {self.spotify.is_enabled()}")
+                self.logger.info(f"🔧 Spotify client not enabled - client status: {self.spotify.spotify is not None}")
+            
+            # If Spotify didn't work (disabled or no cover found), try custom cover art generation
+            if not cover_added:
+                self.logger.info(f"🎨 Attempting custom cover art generation for artist: {artist_name}")
+                try:
+                    # Always try to generate custom cover art with "This is [Artist]" text overlay
+                    self.logger.info(f"🎨 Generating custom cover art for artist: {artist_name}")
+                    
+                    # First, find the source image to use as base
+                    artist_image = self._find_artist_cover_image(artist_name)
+                    if not (artist_image is None):
+                        # Generate custom cover art with text overlay
+                        cover_dest = playlist_dir / f"cover{self.config.cover_extension}"
+                        if self._generate_custom_cover_art(artist_image, artist_name, cover_dest):
+                            cover_added = True
+                            self.logger.info(f"✅ Generated custom cover art for artist: {artist_name}")
+                        else:
+                            self.logger.info(f"❌ Failed to generate custom cover art for artist: {artist_name}")
+                            # Fallback: copy the original image directly
+                            self.logger.info(f"🖼️ Fallback: Using original artist cover image")
+                            fallback_destination = playlist_dir / f"folder{self.config.cover_extension}"
+                            _save_image_atomic(Image.open(BytesIO(artist_image)), fallback_destination)
+                            # Ensure cover art is world-readable on host mounts
+                            _ensure_world_readable(fallback_destination, self.logger)
+                            
+                            cover_added = True
+                            self.logger.info(f"✅ Applied existing artist cover art as fallback for: {artist_name}")
+                    else:
+                        self.logger.info(f"❌ No artist cover art found for: {artist_name}")
+                except Exception as cover_error:
+                    self.logger.error(f"❌ Error generating custom cover art for {artist_name}: {cover_error}")
+        
+        if not cover_added:
+            self.logger.info(f"No cover art applied for playlist: {name}")
+        return cover_added
+
+    def _save_playlists(self, jobs: List[tuple]) -> List[Optional[str]]:
+        """Run save_playlist for each (type, name, tracks) job concurrently, returning results in job order"""
+        if not jobs:
+            return []
+        
+        def run(job):
+            try:
+                return self.save_playlist(*job)
+            except Exception as e:
+                self.logger.error(f"Error saving {job[0].lower()} playlist '{job[1]}': {e}")
+                return None
+        
+        workers = min(self.SAVE_PLAYLIST_WORKERS, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="save-playlist") as executor:
+            return list(executor.map(run, jobs))
+
     def save_playlist(self, playlist_type: str, name: str, tracks: List[Dict], user_id: str = None):
         """Save playlist using Jellyfin's REST API with proper privacy controls and custom cover art"""
         self.logger.info(f"=== STARTING PLAYLIST CREATION ===")
@@ -1955,26 +3004,18 @@ class PlaylistGenerator:
             
             self.logger.info(f"Creating {privacy_text} {playlist_type} playlist: {sanitized_name} with {len(track_ids)} tracks")
             
-            # Check if playlist already exists and delete it (use original name for API calls)
+            # Replace any existing playlist of the same name and create the new one.
             # Use normalized name for API lookups/creation to avoid Unicode duplicates (e.g., ’ vs ')
             api_name = normalize_name(name)
-            self.logger.info(f"Checking for existing playlist: {api_name}")
-            existing_playlist = self.jellyfin.get_playlist_by_name(api_name, user_id)
-            if existing_playlist:
-                self.logger.info(f"Playlist '{name}' already exists, attempting to delete old version with ID: {existing_playlist.get('Id')}")
-                delete_success = self.jellyfin.delete_playlist(existing_playlist['Id'])
-                if delete_success:
-                    self.logger.info(f"✅ Successfully deleted existing playlist")
-                else:
-                    self.logger.info(f"🔄 Could not delete existing playlist (will create new version anyway)")
-                    self.logger.debug(f"Note: Jellyfin may create a duplicate playlist or handle this automatically")
-            else:
-                self.logger.info(f"ℹ️ No existing playlist found with name: {name}")
-        
-            # Create the playlist via API with proper privacy settings (use original name for API)
             self.logger.info(f"🔨 Creating new playlist via Jellyfin API...")
             self.logger.debug(f"API call parameters: name={repr(api_name)}, track_count={len(track_ids)}, user_id={user_id}, is_public={is_public}")
-            result = self.jellyfin.create_playlist(api_name, track_ids, user_id, is_public)
+            result = self.jellyfin.upsert_playlist(api_name, track_ids, user_id, is_public)
+            
+            if result.get('replaced'):
+                self.logger.info(f"✅ Successfully deleted existing playlist")
+                # Jellyfin removes the playlist folder, so any recorded cover is gone too
+                if name.startswith("This is "):
+                    self.spotify.forget_cover_art(name.replace("This is ", "").replace("!", "").strip())
             
             if result['success']:
                 self.logger.info(f"✅ Successfully created {privacy_text} playlist '{sanitized_name}' with {result['track_count']} tracks")
@@ -1992,95 +3033,9 @@ class PlaylistGenerator:
                     self.logger.error(f"Directory path repr: {repr(str(playlist_dir))}")
                     raise
                 
-                # Handle cover art based on playlist type
-                cover_added = False
-                
-                # For personalized playlists, try custom cover art first
-                if playlist_type.lower() == "personal":
-                    self.logger.info(f"Attempting to apply custom cover art for personalized playlist...")
-                    cover_added = self.copy_custom_cover_art(name, playlist_dir)
-                    if cover_added:
-                        self.logger.info(f"✅ Applied custom cover art for personalized playlist: {name}")
-                    else:
-                        self.logger.info(f"No custom cover art found for personalized playlist: {name}")
-                
-                # For decade playlists, try decade-specific cover art
-                elif playlist_type.lower() == "decade" and "Back to the" in name:
-                    self.logger.info(f"🗓️ Attempting to apply decade-specific cover art...")
-                    cover_added = self._apply_decade_cover_art(name, playlist_dir)
-                    if cover_added:
-                        self.logger.info(f"✅ Applied decade-specific cover art for playlist: {name}")
-                    else:
-                        self.logger.info(f"❌ No decade-specific cover art found for playlist: {name}")
-                
-                # For genre playlists, try genre-specific cover art
-                elif playlist_type.lower() == "genre" and " Radio" in name:
-                    # Extract genre name from "[Genre] Radio" format
-                    genre_name = name.replace(" Radio", "").strip()
-                    self.logger.info(f"🎵 Attempting to apply genre-specific cover art for: {genre_name}")
-                    cover_added = self._apply_genre_cover_art(name, genre_name, playlist_dir)
-                    if cover_added:
-                        self.logger.info(f"✅ Applied genre-specific cover art for playlist: {name}")
-                    else:
-                        self.logger.info(f"❌ No genre-specific cover art found for playlist: {name}")
-            
-                # For artist playlists, try Spotify cover art first, then fallback to custom generation
-                self.logger.debug(f"🔍 Cover art check - cover_added: {cover_added}, 'This is' in name: {'This is' in name}, spotify enabled: {self.spotify.is_enabled()}")
-                self.logger.debug(f"🔍 Spotify client status: {self.spotify.spotify is not None}")
-                
-                if not cover_added and "This is" in name:
-                    # Extract artist name from "This is [Artist]!" format
-                    artist_name = name.replace("This is ", "").replace("!", "").strip()
-                    self.logger.info(f"🎯 Extracted artist name: {artist_name}")
-                    
-                    # Try Spotify cover art first if enabled
-                    if self.spotify.is_enabled():
-                        self.logger.info(f"🎨 Attempting to apply Spotify cover art for artist playlist...")
-                        if self.spotify.get_artist_cover_art(artist_name, playlist_dir):
-                            cover_added = True
-                            self.logger.info(f"✅ Applied Spotify cover art for artist playlist: {name}")
-                        else:
-                            self.logger.info(f"❌ No Spotify cover art found for artist: {artist_name}")
-                    else:
-                        self.logger.info(f"⚠️ Spotify cover art skipped - Spotify enabled: {self.spotify.is_enabled()}")
-                        self.logger.info(f"🔧 Spotify client not enabled - client status: {self.spotify.spotify is not None}")
-                    
-                    # If Spotify didn't work (disabled or no cover found), try custom cover art generation
-                    if not cover_added:
-                        self.logger.info(f"🎨 Attempting custom cover art generation for artist: {artist_name}")
-                        try:
-                            # Always try to generate custom cover art with "This is [Artist]" text overlay
-                            self.logger.info(f"🎨 Generating custom cover art for artist: {artist_name}")
-                            
-                            # First, find the source image to use as base
-                            artist_image = self._find_artist_cover_image(artist_name)
-                            if not (artist_image is None):
-                                # Generate custom cover art with text overlay
-                                cover_dest = playlist_dir / 'cover.webp'
-                                if self._generate_custom_cover_art(artist_image, artist_name, cover_dest):
-                                    cover_added = True
-                                    self.logger.info(f"✅ Generated custom cover art for artist: {artist_name}")
-                                else:
-                                    self.logger.info(f"❌ Failed to generate custom cover art for artist: {artist_name}")
-                                    # Fallback: copy the original image directly
-                                    self.logger.info(f"🖼️ Fallback: Using original artist cover image")
-                                    fallback_destination = playlist_dir / "folder.webp"
-                                    Image.open(BytesIO(artist_image)).save(fallback_destination)
-                                    # Ensure cover art is world-readable on host mounts
-                                    try:
-                                        os.chmod(fallback_destination, 0o664)
-                                    except Exception as chmod_err:
-                                        self.logger.debug(f"chmod failed for {fallback_destination}: {chmod_err}")
-                                    
-                                    cover_added = True
-                                    self.logger.info(f"✅ Applied existing artist cover art as fallback for: {artist_name}")
-                            else:
-                                self.logger.info(f"❌ No artist cover art found for: {artist_name}")
-                        except Exception as cover_error:
-                            self.logger.error(f"❌ Error generating custom cover art for {artist_name}: {cover_error}")
-                
-                if not cover_added:
-                    self.logger.info(f"No cover art applied for playlist: {name}")
+                # Cover art is file I/O and image processing; it runs on the I/O pool
+                # so the next playlist's API calls can proceed.
+                self._submit_io(self._apply_cover_art, playlist_type, name, playlist_dir)
                 
                 self.logger.info(f"=== PLAYLIST CREATION COMPLETED SUCCESSFULLY ===")
                 return playlist_dir
@@ -2091,7 +3046,6 @@ class PlaylistGenerator:
                 
         except Exception as e:
             self.logger.error(f"❌ Error saving playlist {name}: {e}")
-            import traceback
             self.logger.error(f"Traceback: {traceback.format_exc()}")
             self.logger.info(f"=== PLAYLIST CREATION FAILED WITH EXCEPTION ===")
             return None
@@ -2106,76 +3060,74 @@ class PlaylistGenerator:
             self.logger.info("📋 Genre grouping disabled - using individual genres")
         
         # Group tracks by genre (with optional mapping to consolidated groups)
-        genre_tracks = {}
-        original_genre_stats = {}  # Track original genre distribution for logging
+        genre_tracks = defaultdict(list)
+        genre_artists = defaultdict(set)  # Unique artists per genre, for the diversity check
+        original_genre_stats = defaultdict(int)  # Track original genre distribution for logging
+        # map_genre_to_group scans every group's list; resolve each distinct genre once
+        group_for_genre = {}
+        excluded_artists = frozenset(self.config.excluded_artists or ())
+        excluded_genres = frozenset(self.config.excluded_genres or ())
+        min_tracks = self.config.min_tracks_per_playlist
+        max_tracks = self.config.max_tracks_per_playlist
+        shuffle = self.config.shuffle_tracks
+        min_artists = self.config.min_artist_diversity
+        map_genre_to_group = self.config.map_genre_to_group
         
         for item in audio_items:
             if not item.get('Genres'):
                 continue
             
             # Check if any artist in this track is excluded
-            if self.config.excluded_artists and item.get('Artists'):
-                excluded_artist_found = False
-                for artist in item['Artists']:
-                    if artist in self.config.excluded_artists:
-                        excluded_artist_found = True
-                        break
-                if excluded_artist_found:
-                    continue
+            artists = item.get('Artists') or ()
+            if excluded_artists and not excluded_artists.isdisjoint(artists):
+                continue
             
-            # Parse genres - handle both list and semicolon-separated string formats
-            genres = []
-            if isinstance(item['Genres'], list):
-                for genre_item in item['Genres']:
-                    if isinstance(genre_item, str) and ';' in genre_item:
-                        # Split semicolon-separated genres
-                        genres.extend([g.strip() for g in genre_item.split(';') if g.strip()])
-                    elif isinstance(genre_item, str):
-                        genres.append(genre_item.strip())
-            elif isinstance(item['Genres'], str):
-                if ';' in item['Genres']:
-                    genres = [g.strip() for g in item['Genres'].split(';') if g.strip()]
-                else:
-                    genres = [item['Genres'].strip()]
+            # Parse genres - Genres is normalized to a list of strings at ingest, and any
+            # entry may hold several semicolon-separated genres: join once, split once
+            raw_genres = item['Genres']
+            if not isinstance(raw_genres, str):
+                raw_genres = ';'.join(raw_genres)
+            genres = [g for g in map(str.strip, raw_genres.split(';')) if g]
             
             # Add track to each genre it belongs to (with optional mapping)
             for original_genre in genres:
-                if original_genre and original_genre not in self.config.excluded_genres:
+                if original_genre and original_genre not in excluded_genres:
                     # Track original genre stats
-                    original_genre_stats[original_genre] = original_genre_stats.get(original_genre, 0) + 1
+                    original_genre_stats[original_genre] += 1
                     
                     # Map to consolidated genre group if grouping is enabled
-                    final_genre = self.config.map_genre_to_group(original_genre)
+                    final_genre = group_for_genre.get(original_genre)
+                    if final_genre is None:
+                        final_genre = group_for_genre[original_genre] = map_genre_to_group(original_genre)
                     
-                    if final_genre not in genre_tracks:
-                        genre_tracks[final_genre] = []
                     genre_tracks[final_genre].append(item)
+                    genre_artists[final_genre].update(artists)
         
         # Create playlists for each genre
+        jobs = []
         for genre, tracks in genre_tracks.items():
-            if len(tracks) < self.config.min_tracks_per_playlist:
+            if len(tracks) < min_tracks:
                 continue
             
-            # Check artist diversity - count unique artists in this genre
-            unique_artists = set()
-            for track in tracks:
-                if track.get('Artists'):
-                    for artist in track['Artists']:
-                        unique_artists.add(artist)
+            # Check artist diversity - unique artists were collected while grouping
+            unique_artists = genre_artists[genre]
             
-            if len(unique_artists) < self.config.min_artist_diversity:
-                self.logger.info(f"Skipping genre '{genre}' - only {len(unique_artists)} artists (minimum: {self.config.min_artist_diversity})")
+            if len(unique_artists) < min_artists:
+                self.logger.info(f"Skipping genre '{genre}' - only {len(unique_artists)} artists (minimum: {min_artists})")
                 continue
                 
             # Limit tracks and shuffle if requested
-            limited_tracks = tracks[:self.config.max_tracks_per_playlist]
-            if self.config.shuffle_tracks:
-                import random
+            limited_tracks = tracks[:max_tracks]
+            if shuffle:
                 random.shuffle(limited_tracks)
             
             playlist_name = f"{genre} Radio"
-            self.save_playlist("Genre", playlist_name, limited_tracks)
-            self.logger.info(f"Created genre playlist '{playlist_name}' with {len(limited_tracks)} tracks from {len(unique_artists)} artists")
+            jobs.append(("Genre", playlist_name, limited_tracks))
+            self.logger.info(f"Queued genre playlist '{playlist_name}' with {len(limited_tracks)} tracks from {len(unique_artists)} artists")
+        
+        for (_, playlist_name, limited_tracks), playlist_dir in zip(jobs, self._save_playlists(jobs)):
+            if playlist_dir:
+                self.logger.info(f"Created genre playlist '{playlist_name}' with {len(limited_tracks)} tracks")
 
     def generate_year_playlists(self, audio_items: List[Dict]):
         """Generate playlists by decade (1980s, 1990s, 2000s, etc.)"""
@@ -2184,80 +3136,84 @@ class PlaylistGenerator:
         
         # Group tracks by decade and collect album data
         decade_data = {}
+        excluded_artists = frozenset(self.config.excluded_artists or ())
+        min_tracks = self.config.min_tracks_per_playlist
+        max_tracks = self.config.max_tracks_per_playlist
+        shuffle = self.config.shuffle_tracks
+        min_artists = self.config.min_artist_diversity
+        min_albums = self.config.min_albums_per_decade
         for item in audio_items:
             year = item.get('ProductionYear')
             if not year or year < 1950:  # Skip very old or invalid years
                 continue
             
             # Check if any artist in this track is excluded
-            if self.config.excluded_artists and item.get('Artists'):
-                excluded_artist_found = False
-                for artist in item['Artists']:
-                    if artist in self.config.excluded_artists:
-                        excluded_artist_found = True
-                        break
-                if excluded_artist_found:
-                    continue
+            if excluded_artists and not excluded_artists.isdisjoint(item.get('Artists') or ()):
+                continue
             
-            # Calculate decade (e.g., 1987 -> 1980s, 2003 -> 2000s)
+            # Calculate decade start (e.g., 1987 -> 1980, 2003 -> 2000); named "1980s" once per decade below
             decade_start = (year // 10) * 10
-            decade_name = f"{decade_start}s"
             
-            if decade_name not in decade_data:
-                decade_data[decade_name] = {
+            data = decade_data.get(decade_start)
+            if data is None:
+                data = decade_data[decade_start] = {
                     'tracks': [],
                     'albums': set(),
                     'artists': set()
                 }
             
-            decade_data[decade_name]['tracks'].append(item)
+            data['tracks'].append(item)
             
             # Track unique albums
             if item.get('Album'):
-                decade_data[decade_name]['albums'].add(item['Album'])
+                data['albums'].add(item['Album'])
             
             # Track unique artists
             if item.get('Artists'):
-                for artist in item['Artists']:
-                    decade_data[decade_name]['artists'].add(artist)
+                data['artists'].update(item['Artists'])
         
         # Create playlists for each decade with album threshold checking
         created_playlists = 0
         skipped_decades = []
+        jobs = []
         
-        for decade, data in decade_data.items():
+        for decade_start, data in decade_data.items():
+            decade = f"{decade_start}s"
             tracks = data['tracks']
             unique_albums = data['albums']
             unique_artists = data['artists']
             
             # Check minimum track count
-            if len(tracks) < self.config.min_tracks_per_playlist:
-                self.logger.info(f"⏭️  Skipping decade '{decade}' - only {len(tracks)} tracks (minimum: {self.config.min_tracks_per_playlist})")
+            if len(tracks) < min_tracks:
+                self.logger.info(f"⏭️  Skipping decade '{decade}' - only {len(tracks)} tracks (minimum: {min_tracks})")
                 skipped_decades.append(f"{decade} ({len(tracks)} tracks)")
                 continue
             
             # Check minimum album count (NEW REQUIREMENT)
-            if len(unique_albums) < self.config.min_albums_per_decade:
-                self.logger.info(f"⏭️  Skipping decade '{decade}' - only {len(unique_albums)} albums (minimum: {self.config.min_albums_per_decade})")
+            if len(unique_albums) < min_albums:
+                self.logger.info(f"⏭️  Skipping decade '{decade}' - only {len(unique_albums)} albums (minimum: {min_albums})")
                 skipped_decades.append(f"{decade} ({len(unique_albums)} albums)")
                 continue
             
             # Check artist diversity
-            if len(unique_artists) < self.config.min_artist_diversity:
-                self.logger.info(f"⏭️  Skipping decade '{decade}' - only {len(unique_artists)} artists (minimum: {self.config.min_artist_diversity})")
+            if len(unique_artists) < min_artists:
+                self.logger.info(f"⏭️  Skipping decade '{decade}' - only {len(unique_artists)} artists (minimum: {min_artists})")
                 skipped_decades.append(f"{decade} ({len(unique_artists)} artists)")
                 continue
                 
             # Limit tracks and shuffle if requested
-            limited_tracks = tracks[:self.config.max_tracks_per_playlist]
-            if self.config.shuffle_tracks:
-                import random
+            limited_tracks = tracks[:max_tracks]
+            if shuffle:
                 random.shuffle(limited_tracks)
             
             playlist_name = f"Back to the {decade}"
-            self.save_playlist("Decade", playlist_name, limited_tracks)
-            created_playlists += 1
-            self.logger.info(f"✅ Created decade playlist '{playlist_name}' with {len(limited_tracks)} tracks from {len(unique_albums)} albums and {len(unique_artists)} artists")
+            jobs.append(("Decade", playlist_name, limited_tracks))
+            self.logger.info(f"Queued decade playlist '{playlist_name}' with {len(limited_tracks)} tracks from {len(unique_albums)} albums and {len(unique_artists)} artists")
+        
+        for (_, playlist_name, limited_tracks), playlist_dir in zip(jobs, self._save_playlists(jobs)):
+            if playlist_dir:
+                created_playlists += 1
+                self.logger.info(f"✅ Created decade playlist '{playlist_name}' with {len(limited_tracks)} tracks")
         
         # Summary logging
         self.logger.info(f"🗓️ Decade playlist generation complete: {created_playlists} playlists created")
@@ -2271,92 +3227,101 @@ class PlaylistGenerator:
         
         # Collect artist data with proper null-byte parsing
         self.logger.info("🎵 Collecting artist data...")
-        artist_data = {}
+        # Artist -> tracks; albums are only counted for artists that pass the track threshold
+        artist_data = defaultdict(list)
         processed_items = 0
+        # Per-item/per-artist debug messages are formatted only when debug logging is on
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         
         for item in audio_items:
             processed_items += 1
-            if processed_items % 100 == 0:
+            if debug and processed_items % 100 == 0:
                 self.logger.debug(f"📊 Processed {processed_items}/{len(audio_items)} audio items")
             
-            # Parse null-byte-separated artist lists
-            parsed_artists = []
-            for artist in item['Artists']:
-                if '\x00' in artist or '\0' in artist:
-                    # Split on null bytes to get individual artists
-                    individual_artists = [a.strip() for a in artist.replace('\0', '\x00').split('\x00') if a.strip()]
-                    self.logger.debug(f"🎵 Parsed multi-artist field: {repr(artist)} -> {individual_artists}")
-                    parsed_artists.extend(individual_artists)
-                else:
-                    parsed_artists.append(artist)
-            
-            # Update the item with parsed artists
-            item['Artists'] = parsed_artists
+            # Parse null-byte-separated artist lists; most items have none, so leave them untouched
+            artists = item['Artists']
+            if any('\x00' in artist for artist in artists):
+                parsed_artists = [a.strip() for artist in artists for a in artist.split('\x00') if a.strip()]
+                if debug:
+                    self.logger.debug(f"🎵 Parsed multi-artist field: {repr(artists)} -> {parsed_artists}")
+                item['Artists'] = parsed_artists
+            else:
+                parsed_artists = artists
             
             for artist in parsed_artists:
                 if 'Old Mervs' in artist:
                     self.logger.info(f"[DEBUG] Found 'Old Mervs' during collection: {repr(artist)}")
-                if artist not in artist_data:
-                    artist_data[artist] = {'tracks': [], 'albums': set()}
-                artist_data[artist]['tracks'].append(item)
-                
-                album = item.get('Album', 'Unknown Album')
-                if album:
-                    # Check for null bytes in album names too
-                    if '\x00' in str(album) or '\0' in str(album):
-                        self.logger.warning(f"⚠️ Found null byte in album name: {repr(album)}")
-                        album = str(album).replace('\x00', '').replace('\0', '').strip()
-                    artist_data[artist]['albums'].add(album)
+                artist_data[artist].append(item)
         
         self.logger.info(f"📊 Processed {processed_items} audio items, found {len(artist_data)} unique artists")
         
         # Create playlists for each artist that meets requirements
         created_playlists = 0
         skipped_artists = []
-        
-        for artist, data in artist_data.items():
-            tracks = data['tracks']
-            album_count = len(data['albums'])
-            
+        excluded_artists = frozenset(self.config.excluded_artists or ())
+        min_tracks = self.config.min_tracks_per_playlist
+        max_tracks = self.config.max_tracks_per_playlist
+        shuffle = self.config.shuffle_tracks
+        min_albums = self.config.min_albums_per_artist
+        jobs = []
+        job_artists = []
+        
+        for artist, tracks in artist_data.items():
             # Debug logging for artist name
-            self.logger.debug(f"Processing artist: {repr(artist)}")
+            if debug:
+                self.logger.debug(f"Processing artist: {repr(artist)}")
             
             # Check if artist is excluded
-            if self.config.excluded_artists and artist in self.config.excluded_artists:
+            if artist in excluded_artists:
                 self.logger.info(f"⏭️  Skipping excluded artist: {artist}")
                 skipped_artists.append(f"{artist} (excluded)")
                 continue
             
             # Check minimum track requirement
-            if len(tracks) < self.config.min_tracks_per_playlist:
-                self.logger.debug(f"Skipping {artist}: only {len(tracks)} tracks (minimum: {self.config.min_tracks_per_playlist})")
+            if len(tracks) < min_tracks:
+                if debug:
+                    self.logger.debug(f"Skipping {artist}: only {len(tracks)} tracks (minimum: {min_tracks})")
                 continue
             
+            albums = set()
+            for track in tracks:
+                album = track.get('Album', 'Unknown Album')
+                if album:
+                    # Check for null bytes in album names too
+                    if '\x00' in str(album):
+                        self.logger.warning(f"⚠️ Found null byte in album name: {repr(album)}")
+                        album = str(album).replace('\x00', '').strip()
+                    albums.add(album)
+            album_count = len(albums)
+            
             # Check minimum album requirement
-            if album_count < self.config.min_albums_per_artist:
-                self.logger.info(f"⏭️  Skipping {artist}: only {album_count} albums (minimum: {self.config.min_albums_per_artist})")
+            if album_count < min_albums:
+                self.logger.info(f"⏭️  Skipping {artist}: only {album_count} albums (minimum: {min_albums})")
                 skipped_artists.append(f"{artist} ({album_count} albums)")
                 continue
             
             self.logger.info(f"✅ Creating playlist for {artist}: {len(tracks)} tracks from {album_count} albums")
             
             # Debug album information
-            self.logger.debug(f"Albums for {artist}: {list(data['albums'])}")
+            if debug:
+                self.logger.debug(f"Albums for {artist}: {list(albums)}")
             
             # Limit tracks and shuffle if requested
-            limited_tracks = tracks[:self.config.max_tracks_per_playlist]
-            if self.config.shuffle_tracks:
-                import random
+            limited_tracks = tracks[:max_tracks]
+            if shuffle:
                 random.shuffle(limited_tracks)
             
             # Create playlist name and log it for debugging
             playlist_name = f"This is {artist}!"
             if 'Old Mervs' in artist:
                 self.logger.info(f"[DEBUG] Pre-sanitization name for 'Old Mervs': {repr(playlist_name)}")
-            self.logger.debug(f"Generated playlist name: {repr(playlist_name)}")
-            
-            playlist_dir = self.save_playlist("Artist", playlist_name, limited_tracks)
+            if debug:
+                self.logger.debug(f"Generated playlist name: {repr(playlist_name)}")
             
+            jobs.append(("Artist", playlist_name, limited_tracks))
+            job_artists.append(artist)
+        
+        for artist, playlist_dir in zip(job_artists, self._save_playlists(jobs)):
             if playlist_dir:
                 created_playlists += 1
                 if 'Old Mervs' in artist:
@@ -2410,24 +3375,122 @@ class PlaylistGenerator:
             self.logger.info("No users selected for personalized playlist generation")
             return
         
-        for user in selected_users:
-            user_id = user.get('Id')
-            user_name = user.get('Name', 'Unknown')
+        self._prefetch_user_data(selected_users)
+        try:
+            self._generate_personalized_for_users(selected_users, audio_items)
+        finally:
+            # Responses are only valid for this batch
+            self.clear_call_cache()
+    
+    def _generate_personalized_for_users(self, selected_users: List[Dict], audio_items: List[Dict]):
+        """Generate all personalized playlist types for each selected user.
+        Users are independent and mostly wait on Jellyfin, so they run in parallel.
+        """
+        workers = min(self.config.personal_workers, len(selected_users))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="personal") as executor:
+            list(executor.map(lambda user: self._generate_personalized_for_user(user, audio_items), selected_users))
+    
+    def _generate_personalized_for_user(self, user: Dict, audio_items: List[Dict]):
+        """Generate all personalized playlist types for one user"""
+        user_id = user.get('Id')
+        user_name = user.get('Name', 'Unknown')
+        
+        if not user_id:
+            return
+            
+        self.logger.info(f"Generating personalized playlists for user: {user_name}")
+        
+        try:
+            # Generate different types of personalized playlists
+            self.generate_user_top_tracks_playlist(user_id, user_name, audio_items)
+            self.generate_user_discovery_playlist(user_id, user_name, audio_items)
+            self.generate_user_recent_favorites_playlist(user_id, user_name, audio_items)
+            self.generate_user_genre_mix_playlist(user_id, user_name, audio_items)
             
+        except Exception as e:
+            self.logger.error(f"Error generating personalized playlists for {user_name}: {e}")
+
+    def _prefetch_user_data(self, users: List[Dict]):
+        """Fetch listening stats, favorites and recent tracks for all users concurrently.
+        The requests are independent and I/O bound, so overlapping them turns the
+        sum of round trips into roughly the slowest one.
+        """
+        calls = []
+        for user in users:
+            user_id = user.get('Id')
             if not user_id:
                 continue
-                
-            self.logger.info(f"Generating personalized playlists for user: {user_name}")
-            
-            try:
-                # Generate different types of personalized playlists
-                self.generate_user_top_tracks_playlist(user_id, user_name, audio_items)
-                self.generate_user_discovery_playlist(user_id, user_name, audio_items)
-                self.generate_user_recent_favorites_playlist(user_id, user_name, audio_items)
-                self.generate_user_genre_mix_playlist(user_id, user_name, audio_items)
-                
-            except Exception as e:
-                self.logger.error(f"Error generating personalized playlists for {user_name}: {e}")
+            calls.append(('stats', user_id, 50))
+            calls.append(('favorites', user_id, None))
+            calls.append(('recent', user_id, 20))
+            calls.append(('recent', user_id, 30))
+        
+        if not calls:
+            return
+        
+        self.logger.info(f"Prefetching user data for {len(users)} users ({len(calls)} requests)...")
+        with ThreadPoolExecutor(max_workers=self.config.jellyfin_max_concurrency) as executor:
+            # Each user's existing playlists are needed to replace them on save
+            for user_id in {key[1] for key in calls}:
+                executor.submit(self._prewarm_playlist_index, user_id)
+            futures = {key: executor.submit(self._fetch_user_data, *key) for key in calls}
+            for key, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Leave it out; the generator will retry the call directly
+                    self.logger.warning(f"Prefetch of {key[0]} for user {key[1]} failed: {e}")
+                    continue
+                with self._call_cache_lock:
+                    self._call_cache[key] = result
+    
+    def _fetch_user_data(self, kind: str, user_id: str, limit: Optional[int]) -> List[Dict]:
+        """Perform a single per-user Jellyfin request"""
+        if kind == 'stats':
+            return self.jellyfin.get_user_listening_stats(user_id, limit=limit)
+        if kind == 'favorites':
+            return self.jellyfin.get_user_favorite_items(user_id)
+        return self.jellyfin.get_recently_played(user_id, limit=limit)
+    
+    def _cached_call(self, key, fn):
+        """Return the memoized result for key, calling fn() on a miss"""
+        with self._call_cache_lock:
+            if key in self._call_cache:
+                return self._call_cache[key]
+        result = fn()
+        with self._call_cache_lock:
+            return self._call_cache.setdefault(key, result)
+    
+    def _prewarm_playlist_index(self, user_id: str = None):
+        """Load the user's existing-playlist index before saves need it"""
+        try:
+            self.jellyfin.load_playlist_index(user_id)
+        except requests.exceptions.RequestException as e:
+            # upsert_playlist falls back to a name search per playlist
+            self.logger.warning(f"Could not index existing playlists: {e}")
+    
+    def clear_call_cache(self):
+        """Forget memoized per-user Jellyfin responses (called at the end of each batch)"""
+        with self._call_cache_lock:
+            self._call_cache.clear()
+    
+    def _get_user_data(self, kind: str, user_id: str, limit: Optional[int] = None) -> List[Dict]:
+        """Return memoized (or prefetched) user data, fetching it on first use"""
+        return self._cached_call((kind, user_id, limit), lambda: self._fetch_user_data(kind, user_id, limit))
+
+    def _get_reference_tracks(self, user_id: str, recent_limit: int = 20):
+        """Return (recent, favorites) for a user.
+        Both are normally prefetched; if either is missing, the two requests are
+        issued together so a miss costs one round trip rather than two.
+        """
+        keys = [('recent', user_id, recent_limit), ('favorites', user_id, None)]
+        with self._call_cache_lock:
+            missing = [key for key in keys if key not in self._call_cache]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                for future in [executor.submit(self._get_user_data, *key) for key in missing]:
+                    future.result()
+        return self._get_user_data('recent', user_id, recent_limit), self._get_user_data('favorites', user_id)
 
     def generate_user_top_tracks_playlist(self, user_id: str, user_name: str, audio_items: List[Dict]):
         """Generate a playlist of user's most played tracks"""
@@ -2438,23 +3501,23 @@ class PlaylistGenerator:
             # Try multiple methods to get user's top tracks
             # Method 1: Try to get listening stats (may not be available in all Jellyfin setups)
             try:
-                listening_stats = self.jellyfin.get_user_listening_stats(user_id, limit=50)
+                listening_stats = self._get_user_data('stats', user_id, 50)
                 if listening_stats:
                     self.logger.info(f"Found {len(listening_stats)} listening stats for {user_name}")
-                    # Extract track IDs from listening stats and find corresponding tracks
-                    stats_track_ids = {stat.get('ItemId') for stat in listening_stats if stat.get('ItemId')}
+                    # Map track IDs from listening stats to play counts and find corresponding tracks
+                    play_counts = {stat['ItemId']: stat.get('PlayCount', 0) for stat in listening_stats if stat.get('ItemId')}
                     
                     for track in audio_items:
-                        if track.get('Id') in stats_track_ids:
-                            # Add play count from stats
-                            for stat in listening_stats:
-                                if stat.get('ItemId') == track.get('Id'):
-                                    track['play_count'] = stat.get('PlayCount', 0)
-                                    break
-                            top_tracks.append(track)
+                        play_count = play_counts.get(track.get('Id'))
+                        if play_count is not None:
+                            # Library tracks are shared between users generated in parallel; annotate a copy
+                            top_tracks.append({**track, 'play_count': play_count})
+                            # Every stats entry found; the rest of the library cannot match
+                            if len(top_tracks) == len(play_counts):
+                                break
                     
                     # Sort by play count
-                    top_tracks.sort(key=lambda x: x.get('play_count', 0), reverse=True)
+                    top_tracks.sort(key=itemgetter('play_count'), reverse=True)
                     self.logger.info(f"Using listening stats - found {len(top_tracks)} tracks with play counts")
                 else:
                     self.logger.info(f"No listening stats returned for {user_name}")
@@ -2465,7 +3528,7 @@ class PlaylistGenerator:
             if not top_tracks:
                 try:
                     self.logger.info(f"Falling back to favorite tracks for {user_name}")
-                    favorite_tracks = self.jellyfin.get_user_favorite_items(user_id)
+                    favorite_tracks = self._get_user_data('favorites', user_id)
                     if favorite_tracks:
                         top_tracks = favorite_tracks
                         self.logger.info(f"Using favorites - found {len(top_tracks)} favorite tracks")
@@ -2478,7 +3541,7 @@ class PlaylistGenerator:
             if not top_tracks:
                 try:
                     self.logger.info(f"Final fallback to recently played tracks for {user_name}")
-                    recent_tracks = self.jellyfin.get_recently_played(user_id, limit=30)
+                    recent_tracks = self._get_user_data('recent', user_id, 30)
                     if recent_tracks:
                         top_tracks = recent_tracks
                         self.logger.info(f"Using recent tracks - found {len(top_tracks)} recently played tracks")
@@ -2497,7 +3560,6 @@ class PlaylistGenerator:
                 # Limit to configured max tracks
                 limited_tracks = top_tracks[:self.config.max_tracks_per_playlist]
                 if self.config.shuffle_tracks:
-                    import random
                     random.shuffle(limited_tracks)
                 
                 playlist_name = f"Top Tracks - {user_name}"
@@ -2508,26 +3570,16 @@ class PlaylistGenerator:
                 
         except Exception as e:
             self.logger.error(f"❌ Error generating top tracks playlist for {user_name}: {e}")
-            import traceback
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
 
     def generate_user_discovery_playlist(self, user_id: str, user_name: str, audio_items: List[Dict]):
         """Generate a discovery playlist with similar songs based on user's listening habits"""
         try:
             # Get user's recently played and favorite tracks
-            recent_tracks = self.jellyfin.get_recently_played(user_id, limit=20)
-            favorite_tracks = self.jellyfin.get_user_favorite_items(user_id)
-            
-            # Combine and deduplicate reference tracks
-            reference_tracks = []
-            seen_ids = set()
+            recent_tracks, favorite_tracks = self._get_reference_tracks(user_id)
             
-            for track_list in [recent_tracks, favorite_tracks]:
-                for track in track_list:
-                    track_id = track.get('Id')
-                    if track_id and track_id not in seen_ids:
-                        reference_tracks.append(track)
-                        seen_ids.add(track_id)
+            # Combine and deduplicate reference tracks by ID, keeping first-seen order
+            reference_tracks = list({t['Id']: t for t in chain(recent_tracks or (), favorite_tracks or ()) if t.get('Id')}.values())
             
             if reference_tracks:
                 # Find similar tracks based on genres
@@ -2540,7 +3592,6 @@ class PlaylistGenerator:
                     diverse_tracks = self._apply_discovery_diversity_controls(similar_tracks)
                     
                     if self.config.shuffle_tracks:
-                        import random
                         random.shuffle(diverse_tracks)
                     
                     # Limit to final playlist size
@@ -2560,13 +3611,12 @@ class PlaylistGenerator:
     def generate_user_recent_favorites_playlist(self, user_id: str, user_name: str, audio_items: List[Dict]):
         """Generate a playlist based on recently played tracks"""
         try:
-            recent_tracks = self.jellyfin.get_recently_played(user_id, limit=30)
+            recent_tracks = self._get_user_data('recent', user_id, 30)
             
             if recent_tracks:
                 # Limit to configured max tracks
                 limited_tracks = recent_tracks[:self.config.max_tracks_per_playlist]
                 if self.config.shuffle_tracks:
-                    import random
                     random.shuffle(limited_tracks)
                 
                 playlist_name = f"Recent Favorites - {user_name}"
@@ -2578,12 +3628,29 @@ class PlaylistGenerator:
         except Exception as e:
             self.logger.error(f"Error generating recent favorites playlist for {user_name}: {e}")
 
+    def _get_tracks_by_genre(self, audio_items: List[Dict]) -> Dict[str, List[Dict]]:
+        """Build (or reuse) the genre -> tracks index for audio_items.
+        Built in one pass and rebuilt whenever a different library list is passed in.
+        """
+        with self._tracks_by_genre_lock:
+            index = self._tracks_by_genre
+            if index is not None and index['tracks'] is audio_items and index['count'] == len(audio_items):
+                return index['by_genre']
+            
+            by_genre = defaultdict(list)
+            for track in audio_items:
+                # A track can carry the same genre twice; list it once per bucket
+                for genre in set(track.get('Genres') or ()):
+                    by_genre[genre].append(track)
+            
+            self._tracks_by_genre = {'tracks': audio_items, 'count': len(audio_items), 'by_genre': by_genre}
+            return by_genre
+
     def generate_user_genre_mix_playlist(self, user_id: str, user_name: str, audio_items: List[Dict]):
         """Generate a mixed playlist from user's favorite genres"""
         try:
             # Get user's favorite and recent tracks to determine preferred genres
-            favorite_tracks = self.jellyfin.get_user_favorite_items(user_id)
-            recent_tracks = self.jellyfin.get_recently_played(user_id, limit=20)
+            recent_tracks, favorite_tracks = self._get_reference_tracks(user_id)
             
             # Combine reference tracks
             reference_tracks = favorite_tracks + recent_tracks
@@ -2593,16 +3660,11 @@ class PlaylistGenerator:
                 return
             
             # Extract and count genres from user's listening history
-            genre_counts = {}
-            for track in reference_tracks:
-                if track.get('Genres'):
-                    track_genres = track['Genres'] if isinstance(track['Genres'], list) else [track['Genres']]
-                    for genre in track_genres:
-                        if isinstance(genre, str):
-                            genre_counts[genre] = genre_counts.get(genre, 0) + 1
+            # (Genres is already a list of strings, see _normalize_item_genres)
+            genre_counts = Counter(chain.from_iterable(track.get('Genres') or () for track in reference_tracks))
             
-            # Get top 3 user genres
-            top_genres = sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+            # Get top 3 user genres (most_common picks them with heapq.nlargest)
+            top_genres = genre_counts.most_common(3)
             
             if not top_genres:
                 self.logger.info(f"No genres found for {user_name}")
@@ -2611,30 +3673,25 @@ class PlaylistGenerator:
             # Find tracks from user's top genres
             genre_mix_tracks = []
             tracks_per_genre = self.config.max_tracks_per_playlist // len(top_genres)
+            tracks_by_genre = self._get_tracks_by_genre(audio_items)
+            reference_ids = {t.get('Id') for t in reference_tracks}
             
             for genre, count in top_genres:
-                genre_tracks = []
-                for track in audio_items:
-                    if track.get('Genres'):
-                        track_genres = track['Genres'] if isinstance(track['Genres'], list) else [track['Genres']]
-                        if genre in track_genres:
-                            # Skip if already in user's collection
-                            if track.get('Id') not in {t.get('Id') for t in reference_tracks}:
-                                genre_tracks.append(track)
+                # Skip tracks already in user's collection
+                genre_tracks = [track for track in tracks_by_genre.get(genre, ()) if track.get('Id') not in reference_ids]
                 
                 # Add random selection from this genre
                 if genre_tracks:
-                    import random
                     selected = random.sample(genre_tracks, min(tracks_per_genre, len(genre_tracks)))
                     genre_mix_tracks.extend(selected)
             
             if genre_mix_tracks:
+                # Each genre contributed a random sample, so the mix is already random within
+                # genres and at most tracks_per_genre * len(top_genres) <= max tracks long;
+                # shuffling only interleaves the genres
                 if self.config.shuffle_tracks:
-                    import random
                     random.shuffle(genre_mix_tracks)
-                
-                # Limit to max tracks
-                limited_tracks = genre_mix_tracks[:self.config.max_tracks_per_playlist]
+                limited_tracks = genre_mix_tracks
                 
                 playlist_name = f"Genre Mix - {user_name}"
                 self.save_playlist("Personal", playlist_name, limited_tracks, user_id)
@@ -2645,14 +3702,24 @@ class PlaylistGenerator:
         except Exception as e:
             self.logger.error(f"Error generating genre mix playlist for {user_name}: {e}")
 
+    PLAYLIST_TYPES = frozenset(('Genre', 'Year', 'Artist', 'Personal'))
+    
     def generate_playlists(self):
         """Main playlist generation function"""
         self.logger.info("🎵 ========== STARTING JELLYJAMS PLAYLIST GENERATION ==========")
-        self.logger.info(f"🔧 Configuration: Max tracks: {self.config.max_tracks_per_playlist}, Min tracks: {self.config.min_tracks_per_playlist}")
-        self.logger.info(f"🔧 Playlist types: {', '.join(self.config.playlist_types)}")
-        self.logger.info(f"🔧 Min albums per artist: {self.config.min_albums_per_artist}")
-        self.logger.info(f"🔧 Excluded genres: {', '.join(self.config.excluded_genres) if self.config.excluded_genres else 'None'}")
-        self.logger.info(f"🔧 Excluded artists: {', '.join(self.config.excluded_artists) if self.config.excluded_artists else 'None'}")
+        # The exclusion lists can be long; only join them when the lines will be emitted
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"🔧 Configuration: Max tracks: {self.config.max_tracks_per_playlist}, Min tracks: {self.config.min_tracks_per_playlist}")
+            self.logger.info(f"🔧 Playlist types: {', '.join(self.config.playlist_types)}")
+            self.logger.info(f"🔧 Min albums per artist: {self.config.min_albums_per_artist}")
+            self.logger.info(f"🔧 Excluded genres: {', '.join(self.config.excluded_genres) if self.config.excluded_genres else 'None'}")
+            self.logger.info(f"🔧 Excluded artists: {', '.join(self.config.excluded_artists) if self.config.excluded_artists else 'None'}")
+        
+        # playlist_types stays an ordered list in Config (it is saved to settings.json and shown in the UI)
+        playlist_types = self.PLAYLIST_TYPES.intersection(self.config.playlist_types)
+        if not playlist_types:
+            self.logger.warning("⚠️ No supported playlist types enabled. Skipping playlist generation.")
+            return
         
         # Test Jellyfin connection
         self.logger.info("🌐 Testing Jellyfin connection...")
@@ -2661,6 +3728,11 @@ class PlaylistGenerator:
             return
         self.logger.info("✅ Jellyfin connection successful")
         
+        # Existing playlists may have changed since the last run
+        self.jellyfin.clear_playlist_index()
+        # One listing of existing playlists up front; every save checks it in-process
+        self._prewarm_playlist_index()
+        
         # Get audio items
         self.logger.info("🎶 Fetching audio items from Jellyfin...")
         audio_items = self.jellyfin.get_audio_items()
@@ -2671,18 +3743,21 @@ class PlaylistGenerator:
         self.logger.info(f"📊 Found {len(audio_items)} audio items in library")
         
         # Generate playlists based on configuration
-        if 'Genre' in self.config.playlist_types:
+        if 'Genre' in playlist_types:
             self.generate_genre_playlists(audio_items)
         
-        if 'Year' in self.config.playlist_types:
+        if 'Year' in playlist_types:
             self.generate_year_playlists(audio_items)
         
-        if 'Artist' in self.config.playlist_types:
+        if 'Artist' in playlist_types:
             self.generate_artist_playlists(audio_items)
         
-        if 'Personal' in self.config.playlist_types:
+        if 'Personal' in playlist_types:
             self.generate_personalized_playlists(audio_items)
         
+        # Make sure every cover is on disk before Jellyfin rescans the folders
+        self.wait_for_cover_art()
+        
         # Trigger Jellyfin library scan to refresh playlists if enabled
         if self.config.trigger_library_scan:
             self.logger.info("Triggering Jellyfin media library scan to refresh playlists...")
@@ -2699,6 +3774,7 @@ def main():
     logger = setup_logging(config)
     
     logger.info("🎵 JellyJams Generator Starting...")
+    _check_image_codecs(logger)
     logger.info(f"Jellyfin URL: {config.jellyfin_url}")
     logger.info(f"Playlist Folder: {config.playlist_folder}")
     logger.info(f"Schedule Mode: {config.schedule_mode}")
@@ -2739,10 +3815,15 @@ def main():
     else:
         logger.warning(f"Unknown schedule mode: {config.schedule_mode}. Defaulting to manual mode.")
     
-    # Keep running
+    # Keep running: sleep until the next job is due instead of polling every minute
+    # (capped at an hour, which also covers manual mode where no job is scheduled)
     while True:
+        idle = schedule.idle_seconds()
+        if idle is None or idle > 3600:
+            idle = 3600
+        if idle > 0:
+            time.sleep(idle)
         schedule.run_pending()
-        time.sleep(60)  # Check every minute
 
 if __name__ == "__main__":
     main()
@@ -6,20 +6,49 @@ JellyJams Web UI - Configuration and Management Interface
 import os
 import sys
 import json
+import time
+import re
+import shutil
+import threading
 import logging
 import requests
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
-from collections import deque
+from xml.etree.ElementTree import iterparse
 from functools import wraps
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, Response, send_file
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.security import check_password_hash, generate_password_hash
 import base64
 from vibecodeplugin import Config, PlaylistGenerator, JellyfinAPI, setup_logging, SpotifyClient
 
+# orjson serializes large API responses (metadata, playlist contents) much faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used for jsonify() and request.json"""
+    # Datetimes go through DefaultJSONProvider.default so they keep Flask's HTTP date format
+    _options = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if ORJSON_AVAILABLE else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
 app.secret_key = os.urandom(24)
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+else:
+    # Compact, unsorted output from the stdlib provider
+    app.json.sort_keys = False
+    app.json.compact = True
 
 # Global configuration
 config = Config()
@@ -57,6 +86,8 @@ def logo():
 class ConfigManager:
     def __init__(self):
         self.config_file = '/data/config/settings.json'
+        # Parsed settings.json, reused until the file's mtime/size change: ((mtime_ns, size), settings)
+        self._settings_cache = None
         self.ensure_config_dir()
     
     def ensure_config_dir(self):
@@ -82,6 +113,7 @@ class ConfigManager:
             'spotify_client_id': getattr(config, 'spotify_client_id', ''),
             'spotify_client_secret': getattr(config, 'spotify_client_secret', ''),
             'spotify_cover_art_enabled': getattr(config, 'spotify_cover_art_enabled', False),
+            'cover_format': getattr(config, 'cover_format', 'webp'),
             'enabled_genres': [],
             'enabled_years': [],
             'enabled_artists': [],
@@ -100,20 +132,37 @@ class ConfigManager:
         
         # Load and merge web UI settings (these take precedence)
         try:
-            if Path(self.config_file).exists():
-                with open(self.config_file, 'r') as f:
-                    web_settings = json.load(f)
-                    # Merge with defaults, but web UI settings override
-                    default_settings.update(web_settings)
-                    logger.info("Loaded web UI settings - these override environment variables")
+            web_settings = self._read_web_settings()
+            if web_settings is not None:
+                # Merge with defaults, but web UI settings override
+                default_settings.update(web_settings)
         except Exception as e:
             logger.error(f"Error loading web UI settings: {e}")
         
         return default_settings
     
+    def _read_web_settings(self):
+        """Parsed settings.json (None if missing), re-read only when the file changes"""
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            self._settings_cache = None
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._settings_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with open(self.config_file, 'r') as f:
+            web_settings = json.load(f)
+        self._settings_cache = (key, web_settings)
+        logger.info("Loaded web UI settings - these override environment variables")
+        return web_settings
+    
     def save_settings(self, settings: Dict):
         """Save settings to JSON file"""
         try:
+            # A rewrite within the same mtime tick must not serve the old parse
+            self._settings_cache = None
             with open(self.config_file, 'w') as f:
                 json.dump(settings, f, indent=2)
             return True
@@ -158,6 +207,7 @@ class ConfigManager:
         config.spotify_client_id = settings.get('spotify_client_id', getattr(config, 'spotify_client_id', ''))
         config.spotify_client_secret = settings.get('spotify_client_secret', getattr(config, 'spotify_client_secret', ''))
         config.spotify_cover_art_enabled = settings.get('spotify_cover_art_enabled', getattr(config, 'spotify_cover_art_enabled', False))
+        config.cover_format = str(settings.get('cover_format', getattr(config, 'cover_format', 'webp'))).lower()
         
         # Apply playlist generation settings
         
@@ -181,6 +231,22 @@ class ConfigManager:
 
 config_manager = ConfigManager()
 
+# Shared Jellyfin client so requests reuse its keep-alive pool and caches;
+# rebuilt when the server URL or API key changes (the key is baked into the session)
+_jellyfin_api = None
+_jellyfin_api_key = None
+_jellyfin_api_lock = threading.Lock()
+
+def get_jellyfin_api() -> JellyfinAPI:
+    """Return the shared JellyfinAPI client for the current Jellyfin settings"""
+    global _jellyfin_api, _jellyfin_api_key
+    key = (config.jellyfin_url, config.api_key)
+    with _jellyfin_api_lock:
+        if _jellyfin_api is None or _jellyfin_api_key != key:
+            _jellyfin_api = JellyfinAPI(config, logger)
+            _jellyfin_api_key = key
+        return _jellyfin_api
+
 # Basic authentication configuration
 _auth_config_cache = None
 
@@ -269,9 +335,12 @@ class DiscordNotifier:
             # Fall back to web UI settings
             try:
                 config_file = '/data/config/settings.json'
-                if Path(config_file).exists():
+                try:
                     with open(config_file, 'r') as f:
                         settings = json.load(f)
+                except FileNotFoundError:
+                    settings = None
+                if settings is not None:
                     self.enabled = settings.get('discord_webhook_enabled', False) and bool(settings.get('discord_webhook_url', ''))
                     self.webhook_url = settings.get('discord_webhook_url', '')
             except Exception as e:
@@ -415,7 +484,7 @@ def index():
     playlist_stats = get_playlist_stats()
     
     # Get Jellyfin connection status
-    jellyfin_api = JellyfinAPI(config, logger)
+    jellyfin_api = get_jellyfin_api()
     jellyfin_connected = jellyfin_api.test_connection()
     
     return render_template('index.html', 
@@ -448,25 +517,45 @@ def playlists():
 def api_users():
     """API endpoint to get Jellyfin users"""
     try:
-        jellyfin_api = JellyfinAPI(config, logger)
+        jellyfin_api = get_jellyfin_api()
         users = jellyfin_api.get_users()
         return jsonify({'success': True, 'users': users})
     except Exception as e:
         logger.error(f"💥 Failed to get Jellyfin users: {e}")
         return jsonify({'success': False, 'message': 'Failed to get Jellyfin users.'})
 
+# Upper bounds for a log tail request, whatever `lines` the client asks for
+LOG_TAIL_MAX_LINES = 5000
+LOG_TAIL_MAX_BYTES = 1024 * 1024
+
+def _tail_lines(path: str, n: int, block_size: int = 65536, max_bytes: int = LOG_TAIL_MAX_BYTES) -> str:
+    """Return the last n lines of a text file.
+    Reads backwards from the end in blocks, so the cost depends on n rather than on
+    how large the log has grown. At most max_bytes are read.
+    """
+    if n <= 0:
+        return ''
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        # n + 1 newlines guarantee the first of the n lines is complete
+        while pos > 0 and len(data) < max_bytes and data.count(b'\n') <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.splitlines(keepends=True)[-n:]
+    return b''.join(lines).decode('utf-8', errors='ignore')
+
 @app.route('/logs')
 @requires_auth
 def logs():
     """Logs page - initial render shows last 100 lines"""
     def read_last_lines(path: str, n: int = 100) -> str:
         try:
-            if not Path(path).exists():
-                return "No logs available"
-            # Efficient tail using deque
-            with open(path, 'r', errors='ignore') as f:
-                dq = deque(f, maxlen=n)
-                return ''.join(dq)
+            return _tail_lines(path, n)
+        except FileNotFoundError:
+            return "No logs available"
         except Exception as e:
             return f"Error reading logs: {e}"
 
@@ -482,16 +571,15 @@ def api_logs_tail():
         lines = int(request.args.get('lines', 100))
     except (TypeError, ValueError):
         lines = 100
+    lines = min(lines, LOG_TAIL_MAX_LINES)
 
     log_file = '/data/logs/jellyjams.log'
 
     def read_last_lines(path: str, n: int) -> str:
         try:
-            if not Path(path).exists():
-                return ""
-            with open(path, 'r', errors='ignore') as f:
-                dq = deque(f, maxlen=n)
-                return ''.join(dq)
+            return _tail_lines(path, n)
+        except FileNotFoundError:
+            return ""
         except Exception as e:
             logger.error(f"Error tailing logs: {e}")
             return ""
@@ -570,6 +658,7 @@ def api_settings():
 
             if config_manager.save_settings(settings):
                 config_manager.apply_settings(settings)
+                invalidate_jellyfin_metadata()
                 return jsonify({'success': True, 'message': 'Settings saved successfully'})
             else:
                 return jsonify({'success': False, 'message': 'Failed to save settings'})
@@ -586,10 +675,11 @@ def save_web_ui_settings(new_settings):
         config_dir.mkdir(parents=True, exist_ok=True)
         
         # Load existing settings if they exist
-        existing_settings = {}
-        if Path(config_file).exists():
+        try:
             with open(config_file, 'r') as f:
                 existing_settings = json.load(f)
+        except FileNotFoundError:
+            existing_settings = {}
         
         # Update with new settings
         existing_settings.update(new_settings)
@@ -616,9 +706,6 @@ def api_generate():
         # Get playlist stats before generation
         stats_before = get_playlist_stats()
         
-        # Import here to ensure logging is set up
-        from vibecodeplugin import setup_logging
-        
         # Setup comprehensive logging for the generator
         generator_logger = setup_logging(config)
         generator_logger.info("🎵 Creating PlaylistGenerator instance from API call")
@@ -634,6 +721,9 @@ def api_generate():
         except Exception as gen_error:
             generation_errors.append(str(gen_error))
             raise
+        finally:
+            # The run fetched a fresh library; let the settings page pick up new genres/artists
+            invalidate_jellyfin_metadata()
         
         # Get playlist stats after generation
         stats_after = get_playlist_stats()
@@ -696,6 +786,7 @@ def api_generate_personalized():
         try:
             # Generate personalized playlists
             generator.generate_personalized_playlists(audio_items)
+            generator.wait_for_cover_art()
         except Exception as gen_error:
             generation_errors.append(str(gen_error))
             raise
@@ -742,7 +833,6 @@ def api_delete_playlist():
         
         playlist_dir = Path(config.playlist_folder) / playlist_name
         if playlist_dir.exists():
-            import shutil
             shutil.rmtree(playlist_dir)
             return jsonify({'success': True, 'message': f'Deleted playlist: {playlist_name}'})
         else:
@@ -762,7 +852,6 @@ def api_delete_all_playlists():
         deleted_count = 0
         for playlist_folder in playlist_dir.iterdir():
             if playlist_folder.is_dir():
-                import shutil
                 shutil.rmtree(playlist_folder)
                 deleted_count += 1
         
@@ -828,7 +917,6 @@ def api_spotify_test():
     """API endpoint to test Spotify integration"""
     try:
         # Get the current Spotify client from the playlist generator
-        from vibecodeplugin import PlaylistGenerator
         generator = PlaylistGenerator(config, logger)
         
         if not generator.spotify:
@@ -860,7 +948,6 @@ def api_spotify_stats():
     """API endpoint to get Spotify integration statistics"""
     try:
         # Get the current Spotify client from the playlist generator
-        from vibecodeplugin import PlaylistGenerator
         generator = PlaylistGenerator(config, logger)
         
         if not generator.spotify:
@@ -900,27 +987,17 @@ def api_spotify_stats():
 def api_playlist_contents(playlist_name):
     """API endpoint to get playlist contents"""
     try:
-        import xml.etree.ElementTree as ET
-        
         playlist_dir = Path(config.playlist_folder) / playlist_name
         playlist_file = playlist_dir / 'playlist.xml'
         
         if not playlist_file.exists():
             return jsonify({'success': False, 'message': 'Playlist file not found'})
         
-        # Parse the XML playlist file (Jellyfin format)
-        tree = ET.parse(playlist_file)
-        root = tree.getroot()
-        
         tracks = []
-        # Look for PlaylistItem elements with Path children
-        for playlist_item in root.findall('.//PlaylistItem'):
-            path_element = playlist_item.find('Path')
-            if path_element is not None and path_element.text:
-                file_path = path_element.text
-                
+        # Stream the PlaylistItem paths from the XML playlist file (Jellyfin format)
+        for file_path in _iter_playlist_item_paths(playlist_file):
+            if file_path:
                 # Extract track info from file path
-                import os
                 filename = os.path.basename(file_path)
                 
                 # Try to parse filename for track info
@@ -976,7 +1053,7 @@ def api_playlist_contents(playlist_name):
 @requires_auth
 def api_jellyfin_test():
     """Test Jellyfin connection"""
-    jellyfin_api = JellyfinAPI(config, logger)
+    jellyfin_api = get_jellyfin_api()
     connected = jellyfin_api.test_connection()
     return jsonify({'connected': connected})
 
@@ -985,19 +1062,21 @@ def api_jellyfin_test():
 def api_metadata():
     """Get Jellyfin metadata - optimized with error handling"""
     try:
-        jellyfin_api = JellyfinAPI(config, logger)
-        
-        # Test connection first
-        if not jellyfin_api.test_connection():
-            return jsonify({
-                'success': False, 
-                'message': 'Cannot connect to Jellyfin server',
-                'genres': [],
-                'years': [],
-                'artists': []
-            })
-        
-        metadata = get_jellyfin_metadata(jellyfin_api)
+        metadata = get_cached_jellyfin_metadata()
+        if metadata is None:
+            jellyfin_api = get_jellyfin_api()
+            
+            # Test connection first
+            if not jellyfin_api.test_connection():
+                return jsonify({
+                    'success': False, 
+                    'message': 'Cannot connect to Jellyfin server',
+                    'genres': [],
+                    'years': [],
+                    'artists': []
+                })
+            
+            metadata = get_jellyfin_metadata(jellyfin_api)
         return jsonify({
             'success': True,
             'genres': metadata.get('genres', []),
@@ -1019,17 +1098,19 @@ def api_metadata():
 def api_artists():
     """Get all artists from Jellyfin for excluded artists functionality"""
     try:
-        jellyfin_api = JellyfinAPI(config, logger)
-        
-        # Test connection first
-        if not jellyfin_api.test_connection():
-            return jsonify({
-                'success': False, 
-                'message': 'Cannot connect to Jellyfin server',
-                'artists': []
-            })
-        
-        metadata = get_jellyfin_metadata(jellyfin_api)
+        metadata = get_cached_jellyfin_metadata()
+        if metadata is None:
+            jellyfin_api = get_jellyfin_api()
+            
+            # Test connection first
+            if not jellyfin_api.test_connection():
+                return jsonify({
+                    'success': False, 
+                    'message': 'Cannot connect to Jellyfin server',
+                    'artists': []
+                })
+            
+            metadata = get_jellyfin_metadata(jellyfin_api)
         artists = metadata.get('artists', [])
         
         return jsonify({
@@ -1050,7 +1131,6 @@ def api_artists():
 def api_update_covers():
     """Update cover art for existing playlists with optimized performance to prevent worker timeouts"""
     try:
-        import time
         start_time = time.time()
         
         logger.info("🎨 Starting optimized cover art update process...")
@@ -1117,7 +1197,6 @@ def api_update_covers():
                     # Artist playlist - extract artist name and clean up extra characters
                     artist_name = playlist_name.replace("This is ", "")
                     # Remove exclamation marks and any trailing numbers/characters
-                    import re
                     artist_name = re.sub(r'[!]+\d*$', '', artist_name).strip()
                     
                     # Only process if we have a valid artist name after cleaning
@@ -1147,7 +1226,7 @@ def api_update_covers():
                                 if artist_image:
                                     logger.info(f"🖼️ Found artist image")
                                     # Generate custom cover art with proper parameters
-                                    cover_destination = playlist_dir / "folder.webp"
+                                    cover_destination = playlist_dir / f"folder{config.cover_extension}"
                                     custom_success = generator._generate_custom_cover_art(artist_image, artist_name, cover_destination)
                                     if custom_success:
                                         logger.info(f"✅ Generated custom cover art for {artist_name}")
@@ -1160,7 +1239,6 @@ def api_update_covers():
                         # Try folder fallback if both failed
                         if not cover_updated:
                             try:
-                                generator = PlaylistGenerator(config, jellyfin_logger)
                                 if hasattr(generator, '_try_artist_folder_fallback'):
                                     fallback_success = generator._try_artist_folder_fallback(artist_name, playlist_dir)
                                     if fallback_success:
@@ -1251,6 +1329,10 @@ def api_update_covers():
                 error_count += 1
                 logger.error(f"❌ Error updating cover for {playlist_name}: {e}")
         
+        # Release the cover rendering worker processes and persist the covers manifest
+        generator.wait_for_cover_art()
+        spotify.save_manifest()
+        
         # Return results
         message = f"Cover art update complete: {updated_count} updated, {skipped_count} skipped, {error_count} errors"
         logger.info(f"🎨 {message}")
@@ -1324,6 +1406,42 @@ def api_save_user_settings():
         logger.error(f"Error saving user settings: {e}")
         return jsonify({'success': False, 'message': str(e)})
 
+def _iter_playlist_dirs(playlist_dir: Path):
+    """Yield (playlist_path, playlist.xml stat) for each playlist folder.
+    scandir reports folders without a stat per entry, and the single stat of
+    playlist.xml doubles as the existence check.
+    """
+    with os.scandir(playlist_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                xml_stat = os.stat(os.path.join(entry.path, 'playlist.xml'))
+            except OSError:
+                # Missing, unreadable or not a folder: skip it like exists() returning False
+                continue
+            yield Path(entry.path), xml_stat
+
+# Cover images whose timestamps hint at when a playlist folder was created
+_COVER_HINT_NAMES = frozenset(
+    f"{base}{ext}" for base in ('folder', 'cover') for ext in ('.png', '.jpg', '.jpeg', '.webp', '.avif')
+)
+
+# Personal playlists (and anything else with these prefixes) are never genre playlists
+_PERSONAL_PLAYLIST_PREFIXES = ('Top Tracks', 'Discovery', 'Recent', 'Genre')
+
+def _categorize_playlist(playlist_name: str) -> str:
+    """Category of a playlist folder name: 'artist', 'year', 'personal' or 'genre'"""
+    if playlist_name.startswith('This is '):
+        return 'artist'
+    if playlist_name.startswith('Back to the '):
+        return 'year'
+    # str.startswith checks the whole prefix tuple in one call
+    if playlist_name.startswith(_PERSONAL_PLAYLIST_PREFIXES):
+        return 'personal'
+    # Genre playlists are typically just the genre name
+    return 'genre'
+
 def get_playlist_stats():
     """Get playlist statistics using the same categorization logic as get_detailed_playlist_info"""
     try:
@@ -1339,32 +1457,34 @@ def get_playlist_stats():
             'personal': 0
         }
         
-        for playlist_path in playlist_dir.iterdir():
-            if playlist_path.is_dir():
-                xml_file = playlist_path / 'playlist.xml'
-                if xml_file.exists():
-                    playlist_name = playlist_path.name
-                    stats['total'] += 1
-                    
-                    # Use same categorization logic as get_detailed_playlist_info
-                    if playlist_name.startswith('This is '):
-                        stats['artist'] += 1
-                    elif playlist_name.startswith('Back to the '):
-                        stats['year'] += 1
-                    elif playlist_name in ['Top Tracks - all', 'Discovery Mix', 'Recent Favorites', 'Genre Mix']:
-                        stats['personal'] += 1
-                    else:
-                        # Check if it's a genre playlist (not starting with special prefixes)
-                        if not any(playlist_name.startswith(prefix) for prefix in ['This is ', 'Back to the ', 'Top Tracks', 'Discovery', 'Recent', 'Genre']):
-                            stats['genre'] += 1
-                        else:
-                            stats['personal'] += 1
+        for playlist_path, _ in _iter_playlist_dirs(playlist_dir):
+            stats['total'] += 1
+            stats[_categorize_playlist(playlist_path.name)] += 1
         
         return stats
     except Exception as e:
         logger.error(f"Error getting playlist stats: {e}")
         return {'total': 0, 'genre': 0, 'year': 0, 'artist': 0, 'personal': 0}
 
+def _iter_playlist_item_paths(xml_file):
+    """Yield the Path text of each PlaylistItem in a playlist.xml (None if it has none).
+    The file is streamed and each item is cleared once read, so no full tree is built.
+    """
+    in_item = False
+    path = None
+    for event, elem in iterparse(str(xml_file), events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if tag == 'PlaylistItem':
+                in_item, path = True, None
+        elif tag == 'Path':
+            if in_item:
+                path = elem.text
+        elif tag == 'PlaylistItem':
+            in_item = False
+            yield path
+            elem.clear()
+
 def get_detailed_playlist_info():
     """Get detailed playlist information with proper categorization"""
     try:
@@ -1390,148 +1510,119 @@ def get_detailed_playlist_info():
             'personal': 0
         }
         
-        for playlist_path in playlist_dir.iterdir():
-            if playlist_path.is_dir():
-                xml_file = playlist_path / 'playlist.xml'
-                if xml_file.exists():
-                    # Get file stats
-                    stat = xml_file.stat()
-                    # Modified time comes from the playlist file (updates when overwritten/changed)
-                    modified = datetime.fromtimestamp(stat.st_mtime)
-
-                    # Stable created time handling: persist a created.txt alongside the playlist
-                    created_file = playlist_path / 'created.txt'
-                    created = None
-                    if created_file.exists():
-                        try:
-                            created_text = created_file.read_text(encoding='utf-8').strip()
-                            # Support both ISO and formatted timestamps
-                            try:
-                                created = datetime.fromisoformat(created_text)
-                            except ValueError:
-                                created = datetime.strptime(created_text, '%Y-%m-%d %H:%M:%S')
-                        except Exception:
-                            created = None
-                    if created is None:
-                        # Infer a best-effort creation time from available filesystem timestamps
-                        # Note: st_ctime on Linux is ctime (metadata change), so prefer the oldest among candidates
-                        candidates = [
-                            stat.st_mtime,            # xml modified
-                            stat.st_ctime             # xml ctime/change time
-                        ]
-                        try:
-                            dir_stat = playlist_path.stat()
-                            candidates.extend([dir_stat.st_mtime, dir_stat.st_ctime])
-                        except Exception:
-                            pass
-                        try:
-                            # Consider cover image if present as an additional hint
-                            for base in ['folder', 'cover']:
-                                for ext in ['.png', '.jpg', '.jpeg', '.webp', '.avif']:
-                                    cf = playlist_path / f"{base}{ext}"
-                                    if cf.exists():
-                                        cfs = cf.stat()
-                                        candidates.extend([cfs.st_mtime, cfs.st_ctime])
-                        except Exception:
-                            pass
-
-                        # Choose the earliest plausible timestamp
-                        created_ts = min(candidates) if candidates else stat.st_mtime
-                        created = datetime.fromtimestamp(created_ts)
-
-                        # Persist for future stable display
-                        try:
-                            created_file.write_text(created.isoformat(), encoding='utf-8')
-                        except Exception:
-                            # Non-fatal if we cannot write; UI will still show inferred value
-                            pass
-                    
-                    # Try to get track info from XML
-                    track_count = 0
-                    current_tracks = set()
-                    try:
-                        import xml.etree.ElementTree as ET
-                        tree = ET.parse(xml_file)
-                        playlist_items = tree.find('PlaylistItems')
-                        if playlist_items is not None:
-                            items = playlist_items.findall('PlaylistItem')
-                            track_count = len(items)
-                            for it in items:
-                                p = it.find('Path')
-                                if p is not None and p.text:
-                                    current_tracks.add(p.text.strip())
-                    except Exception:
-                        pass
-
-                    # Compute change summary (+added / -removed) vs previous snapshot
-                    delta_added = None
-                    delta_removed = None
-                    try:
-                        import json as _json
-                        snapshot_path = playlist_path / 'last_tracks.json'
-                        current_mtime_iso = modified.isoformat()
-                        if snapshot_path.exists():
-                            data = _json.loads(snapshot_path.read_text(encoding='utf-8'))
-                            prev_tracks = set(data.get('tracks', []))
-                            prev_mtime = data.get('mtime')
-                            # Compare regardless of mtime to detect differences
-                            if prev_tracks:
-                                delta_added = len(current_tracks - prev_tracks)
-                                delta_removed = len(prev_tracks - current_tracks)
-                        else:
-                            # First time snapshot: treat all as added
-                            delta_added = len(current_tracks) if current_tracks else track_count
-                            delta_removed = 0
-
-                        # Update snapshot to current state (best effort)
-                        try:
-                            snapshot_path.write_text(
-                                _json.dumps({
-                                    'mtime': current_mtime_iso,
-                                    'tracks': sorted(list(current_tracks))
-                                }, indent=2),
-                                encoding='utf-8'
-                            )
-                        except Exception:
-                            pass
-                    except Exception:
-                        # If snapshot logic fails, just omit deltas
-                        pass
-                    
-                    # Determine playlist category
-                    playlist_name = playlist_path.name
-                    category = 'personal'  # Default category
-                    
-                    if playlist_name.startswith('This is '):
-                        category = 'artist'
-                        stats['artist'] += 1
-                    elif playlist_name.startswith('Back to the '):
-                        category = 'year'
-                        stats['year'] += 1
-                    elif playlist_name in ['Top Tracks - all', 'Discovery Mix', 'Recent Favorites', 'Genre Mix']:
-                        category = 'personal'
-                        stats['personal'] += 1
-                    else:
-                        # Check if it's a genre playlist (not starting with special prefixes)
-                        # Genre playlists are typically just the genre name
-                        if not any(playlist_name.startswith(prefix) for prefix in ['This is ', 'Back to the ', 'Top Tracks', 'Discovery', 'Recent', 'Genre']):
-                            category = 'genre'
-                            stats['genre'] += 1
-                        else:
-                            stats['personal'] += 1
-                    
-                    stats['total'] += 1
-                    
-                    playlists.append({
-                        'name': playlist_name,
-                        'category': category,
-                        'track_count': track_count,
-                        'created': created.strftime('%Y-%m-%d %H:%M:%S'),
-                        'modified': modified.strftime('%Y-%m-%d %H:%M:%S'),
-                        'delta_added': delta_added,
-                        'delta_removed': delta_removed,
-                        'size': xml_file.stat().st_size
-                    })
+        for playlist_path, stat in _iter_playlist_dirs(playlist_dir):
+            xml_file = playlist_path / 'playlist.xml'
+            # Modified time comes from the playlist file (updates when overwritten/changed)
+            modified = datetime.fromtimestamp(stat.st_mtime)
+
+            # Stable created time handling: persist a created.txt alongside the playlist
+            created_file = playlist_path / 'created.txt'
+            created = None
+            # A missing created.txt raises here as well, saving a separate exists() check
+            try:
+                created_text = created_file.read_text(encoding='utf-8').strip()
+                # Support both ISO and formatted timestamps
+                try:
+                    created = datetime.fromisoformat(created_text)
+                except ValueError:
+                    created = datetime.strptime(created_text, '%Y-%m-%d %H:%M:%S')
+            except Exception:
+                created = None
+            if created is None:
+                # Infer a best-effort creation time from available filesystem timestamps
+                # Note: st_ctime on Linux is ctime (metadata change), so prefer the oldest among candidates
+                candidates = [
+                    stat.st_mtime,            # xml modified
+                    stat.st_ctime             # xml ctime/change time
+                ]
+                try:
+                    dir_stat = playlist_path.stat()
+                    candidates.extend([dir_stat.st_mtime, dir_stat.st_ctime])
+                except Exception:
+                    pass
+                try:
+                    # Consider cover image if present as an additional hint
+                    # (one directory listing instead of a stat per candidate name)
+                    with os.scandir(playlist_path) as entries:
+                        for entry in entries:
+                            if entry.name in _COVER_HINT_NAMES:
+                                cfs = entry.stat()
+                                candidates.extend([cfs.st_mtime, cfs.st_ctime])
+                except Exception:
+                    pass
+
+                # Choose the earliest plausible timestamp
+                created_ts = min(candidates) if candidates else stat.st_mtime
+                created = datetime.fromtimestamp(created_ts)
+
+                # Persist for future stable display
+                try:
+                    created_file.write_text(created.isoformat(), encoding='utf-8')
+                except Exception:
+                    # Non-fatal if we cannot write; UI will still show inferred value
+                    pass
+            
+            # Try to get track info from XML
+            track_count = 0
+            current_tracks = set()
+            try:
+                for item_path in _iter_playlist_item_paths(xml_file):
+                    track_count += 1
+                    if item_path:
+                        current_tracks.add(item_path.strip())
+            except Exception:
+                pass
+
+            # Compute change summary (+added / -removed) vs previous snapshot
+            delta_added = None
+            delta_removed = None
+            try:
+                snapshot_path = playlist_path / 'last_tracks.json'
+                current_mtime_iso = modified.isoformat()
+                if snapshot_path.exists():
+                    data = json.loads(snapshot_path.read_text(encoding='utf-8'))
+                    prev_tracks = set(data.get('tracks', []))
+                    prev_mtime = data.get('mtime')
+                    # Compare regardless of mtime to detect differences
+                    if prev_tracks:
+                        delta_added = len(current_tracks - prev_tracks)
+                        delta_removed = len(prev_tracks - current_tracks)
+                else:
+                    # First time snapshot: treat all as added
+                    delta_added = len(current_tracks) if current_tracks else track_count
+                    delta_removed = 0
+
+                # Update snapshot to current state (best effort)
+                try:
+                    snapshot_path.write_text(
+                        json.dumps({
+                            'mtime': current_mtime_iso,
+                            'tracks': sorted(list(current_tracks))
+                        }, indent=2),
+                        encoding='utf-8'
+                    )
+                except Exception:
+                    pass
+            except Exception:
+                # If snapshot logic fails, just omit deltas
+                pass
+            
+            # Determine playlist category
+            playlist_name = playlist_path.name
+            category = _categorize_playlist(playlist_name)
+            stats[category] += 1
+            stats['total'] += 1
+            
+            playlists.append({
+                'name': playlist_name,
+                'category': category,
+                'track_count': track_count,
+                'created': created.strftime('%Y-%m-%d %H:%M:%S'),
+                'modified': modified.strftime('%Y-%m-%d %H:%M:%S'),
+                'delta_added': delta_added,
+                'delta_removed': delta_removed,
+                'size': stat.st_size
+            })
         
         return {
             'playlists': sorted(playlists, key=lambda x: x['name']),
@@ -1550,57 +1641,113 @@ def get_detailed_playlist_info():
             }
         }
 
+# Genres/years/artists derived from the whole library, reused for METADATA_CACHE_TTL seconds
+METADATA_CACHE_TTL = 600
+# Touched on invalidation so every gunicorn worker drops its in-memory copy
+METADATA_STAMP_FILE = Path('/data/cache/metadata.stamp')
+_metadata_cache = None  # (timestamp, cache key, metadata)
+_metadata_generation = 0  # bumped by every invalidation in this process
+_metadata_lock = threading.Lock()
+
+def _metadata_cache_key():
+    """Server, credentials and last invalidation time the cached metadata belongs to"""
+    try:
+        stamp = os.stat(METADATA_STAMP_FILE).st_mtime_ns
+    except OSError:
+        stamp = 0
+    return (config.jellyfin_url, config.api_key, stamp, _metadata_generation)
+
+def get_cached_jellyfin_metadata():
+    """Return metadata fetched within the last METADATA_CACHE_TTL seconds, or None"""
+    cached = _metadata_cache
+    if (cached is not None and time.monotonic() - cached[0] < METADATA_CACHE_TTL
+            and cached[1] == _metadata_cache_key()):
+        return cached[2]
+    return None
+
+def invalidate_jellyfin_metadata():
+    """Drop cached metadata in every worker so the next request fetches the library again"""
+    global _metadata_cache, _metadata_generation
+    _metadata_generation += 1
+    _metadata_cache = None
+    try:
+        METADATA_STAMP_FILE.parent.mkdir(parents=True, exist_ok=True)
+        METADATA_STAMP_FILE.touch()
+    except OSError as e:
+        logger.debug(f"Could not touch {METADATA_STAMP_FILE}: {e}")
+
+def _iter_multi(value):
+    """Stripped, non-empty names from a list and/or string of semicolon-separated names"""
+    if not value:
+        return ()
+    if not isinstance(value, str):
+        # Join once and split once instead of splitting each entry
+        value = ';'.join(v for v in value if isinstance(v, str))
+    return filter(None, map(str.strip, value.split(';')))
+
+def _scan_library_metadata(jellyfin_api):
+    """Collect genres, years and artists by walking every audio item (fallback path)"""
+    audio_items = jellyfin_api.get_audio_items()
+    
+    genres = set()
+    years = set()
+    artists = set()
+    
+    for item in audio_items:
+        # Parse genres and artists - lists and/or semicolon-separated strings
+        genres.update(_iter_multi(item.get('Genres')))
+        artists.update(_iter_multi(item.get('Artists')))
+        
+        # Parse years
+        if item.get('ProductionYear'):
+            years.add(item['ProductionYear'])
+    
+    return genres, years, artists
+
 def get_jellyfin_metadata(jellyfin_api):
-    """Get available genres, years, and artists from Jellyfin"""
+    """Get available genres, years, and artists from Jellyfin.
+    Callers check get_cached_jellyfin_metadata() first (before testing the connection);
+    this only fetches, unless another request refreshed the cache in the meantime.
+    """
+    with _metadata_lock:
+        # Another request may have refreshed the cache while we waited for the lock
+        cached = get_cached_jellyfin_metadata()
+        if cached is not None:
+            return cached
+        return _fetch_jellyfin_metadata(jellyfin_api)
+
+def _fetch_jellyfin_metadata(jellyfin_api):
+    """Fetch genres, years, and artists from Jellyfin and store them in the metadata cache"""
+    global _metadata_cache
+    # An invalidation while the fetch runs changes the key, and the result is then dropped
+    cache_key = _metadata_cache_key()
     try:
-        audio_items = jellyfin_api.get_audio_items()
-        
-        genres = set()
-        years = set()
-        artists = set()
-        
-        for item in audio_items:
-            # Parse genres - handle both list and semicolon-separated string formats
-            if item.get('Genres'):
-                if isinstance(item['Genres'], list):
-                    for genre_item in item['Genres']:
-                        if isinstance(genre_item, str) and ';' in genre_item:
-                            # Split semicolon-separated genres
-                            genres.update([g.strip() for g in genre_item.split(';') if g.strip()])
-                        else:
-                            genres.add(genre_item)
-                elif isinstance(item['Genres'], str):
-                    # Handle string format with semicolons
-                    if ';' in item['Genres']:
-                        genres.update([g.strip() for g in item['Genres'].split(';') if g.strip()])
-                    else:
-                        genres.add(item['Genres'])
-            
-            # Parse years
-            if item.get('ProductionYear'):
-                years.add(item['ProductionYear'])
-            
-            # Parse artists - handle semicolon-separated artists too
-            if item.get('Artists'):
-                if isinstance(item['Artists'], list):
-                    for artist_item in item['Artists']:
-                        if isinstance(artist_item, str) and ';' in artist_item:
-                            # Split semicolon-separated artists
-                            artists.update([a.strip() for a in artist_item.split(';') if a.strip()])
-                        else:
-                            artists.add(artist_item)
-                elif isinstance(item['Artists'], str):
-                    # Handle string format with semicolons
-                    if ';' in item['Artists']:
-                        artists.update([a.strip() for a in item['Artists'].split(';') if a.strip()])
-                    else:
-                        artists.add(item['Artists'])
+        aggregated = None
+        try:
+            # Jellyfin's aggregate endpoints return one row per value rather than per track
+            aggregated = (
+                set(_iter_multi(jellyfin_api.get_genres())),
+                set(jellyfin_api.get_years()),
+                set(_iter_multi(jellyfin_api.get_artists()))
+            )
+        except Exception as e:
+            logger.warning(f"Aggregate metadata endpoints unavailable ({e}), scanning the audio library instead")
+        if aggregated is not None and all(aggregated):
+            genres, years, artists = aggregated
+        else:
+            if aggregated is not None:
+                logger.info("Aggregate metadata endpoints returned an empty list, scanning the audio library instead")
+            genres, years, artists = _scan_library_metadata(jellyfin_api)
         
-        return {
+        metadata = {
             'genres': sorted(list(genres)),
             'years': sorted(list(years), reverse=True),
             'artists': sorted(list(artists))
         }
+        # An empty library (or an unreachable server) is not worth remembering
+        if (genres or years or artists) and _metadata_cache_key() == cache_key:
+            _metadata_cache = (time.monotonic(), cache_key, metadata)
+        return metadata
     except Exception as e:
         logger.error(f"Error getting Jellyfin metadata: {e}")
         return {'genres': [], 'years': [], 'artists': []}